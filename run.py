@@ -2,64 +2,220 @@
 """CLI entry point for running scripts."""
 
 import argparse
+import contextlib
+import json
 import sys
 
-from rich.console import Console
-from rich.table import Table
-
-from scripts import SCRIPTS
-
-
-console = Console()
+from scripts import SCRIPTS, load_script
+from scripts._console import get_console
 
 
 def list_scripts():
     """Print available scripts in a table."""
+    from rich.table import Table
+
+    console = get_console()
     table = Table(title="Available Scripts")
     table.add_column("Name", style="cyan")
     table.add_column("Description", style="green")
     table.add_column("Version", style="dim")
 
-    for name, script_class in SCRIPTS.items():
+    for name, spec in SCRIPTS.items():
         table.add_row(
             name,
-            script_class.config.description,
-            script_class.config.version
+            spec.description,
+            spec.version
         )
 
     console.print(table)
 
 
-def run_script(script_name: str, verbose: bool = False, **kwargs):
+def run_script(script_name: str, verbose: bool = False, json_output: bool = False, **kwargs):
     """Run the specified script."""
     if script_name not in SCRIPTS:
+        console = get_console()
         console.print(f"[red]Error: Unknown script '{script_name}'[/red]")
         console.print()
         list_scripts()
         sys.exit(1)
 
-    script_class = SCRIPTS[script_name]
-    script = script_class()
+    script = load_script(script_name).get_instance()
 
-    console.print(f"[bold cyan]Running: {script.config.name}[/bold cyan]")
-    console.print(f"[dim]{script.config.description}[/dim]")
-    console.print()
+    if json_output:
+        # Only the result goes to stdout; anything the script still prints goes to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            result = script.run(verbose=verbose, quiet=True, **kwargs)
+        print(json.dumps(result.to_dict()))
+        return 0 if result.success else 1
+
+    console = get_console()
+
+    # Consecutive prints inside `with console` are written and flushed once
+    with console:
+        console.print(f"[bold cyan]Running: {script.config.name}[/bold cyan]")
+        console.print(f"[dim]{script.config.description}[/dim]")
+        console.print()
 
     result = script.run(verbose=verbose, **kwargs)
 
     # Print final result summary
-    console.print()
-    if result.success:
-        console.print(f"[bold green]Result: {result.message}[/bold green]")
-    else:
-        console.print(f"[bold red]Result: {result.message}[/bold red]")
-        for error in result.errors:
-            console.print(f"[red]  - {error}[/red]")
+    with console:
+        console.print()
+        if result.success:
+            console.print(f"[bold green]Result: {result.message}[/bold green]")
+        else:
+            console.print(f"[bold red]Result: {result.message}[/bold red]")
+            for error in result.errors:
+                console.print(f"[red]  - {error}[/red]")
 
     return 0 if result.success else 1
 
 
+def _add_project_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--project",
+        help="Project name from projects.yaml",
+    )
+
+
+def _require_project(args: argparse.Namespace) -> bool:
+    """Print an error and return False if --project is missing."""
+    if args.project:
+        return True
+    console = get_console()
+    console.print(f"[red]Error: --project is required for {args.script}[/red]")
+    console.print(f"[dim]Example: python run.py {args.script} --project test[/dim]")
+    return False
+
+
+def _build_file_reader_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--path",
+        default=".",
+        help="Directory path to search (default: current directory)",
+    )
+    parser.add_argument(
+        "--pattern",
+        default="*",
+        help="File pattern to match (default: *)",
+    )
+    parser.add_argument(
+        "--sort",
+        action="store_true",
+        help="Sort files by path (default: directory order)",
+    )
+    parser.set_defaults(build_kwargs=lambda args: {
+        "path": args.path,
+        "pattern": args.pattern,
+        "sort": args.sort,
+    })
+
+
+def _workflow_dispatch_kwargs(args: argparse.Namespace):
+    if not _require_project(args):
+        return None
+
+    # A comma-separated --project triggers and monitors several projects together
+    projects = [name.strip() for name in args.project.split(",") if name.strip()]
+    project = projects if len(projects) > 1 else args.project
+
+    kwargs = {"project": project, "wait": not args.no_wait}
+    if args.workflow:
+        kwargs["workflow"] = args.workflow
+    if args.branch:
+        kwargs["branch"] = args.branch
+    if args.params:
+        kwargs["params"] = args.params
+    return kwargs
+
+
+def _build_workflow_dispatch_parser(parser: argparse.ArgumentParser) -> None:
+    _add_project_argument(parser)
+    parser.add_argument(
+        "--workflow",
+        help="Override workflow file name",
+    )
+    parser.add_argument(
+        "--branch",
+        help="Override branch name",
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        dest="params",
+        metavar="KEY=VALUE",
+        help="Workflow parameter (can be repeated)",
+    )
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Don't wait for workflow completion",
+    )
+    parser.set_defaults(build_kwargs=_workflow_dispatch_kwargs)
+
+
+def _workflow_status_kwargs(args: argparse.Namespace):
+    if not _require_project(args):
+        return None
+
+    # A comma-separated --project checks several projects in one request
+    projects = [name.strip() for name in args.project.split(",") if name.strip()]
+    project = projects if len(projects) > 1 else args.project
+
+    kwargs = {"project": project}
+    if args.workflow:
+        kwargs["workflow"] = args.workflow
+    return kwargs
+
+
+def _build_workflow_status_parser(parser: argparse.ArgumentParser) -> None:
+    _add_project_argument(parser)
+    parser.add_argument(
+        "--workflow",
+        help="Override workflow file name",
+    )
+    parser.set_defaults(build_kwargs=_workflow_status_kwargs)
+
+
+def _workflow_list_kwargs(args: argparse.Namespace):
+    if not _require_project(args):
+        return None
+
+    return {"project": args.project}
+
+
+def _build_workflow_list_parser(parser: argparse.ArgumentParser) -> None:
+    _add_project_argument(parser)
+    parser.set_defaults(build_kwargs=_workflow_list_kwargs)
+
+
+def _build_workflow_status_all_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--sort",
+        action="store_true",
+        help="Sort projects by name (default: projects.yaml order)",
+    )
+    parser.set_defaults(build_kwargs=lambda args: {"sort": args.sort})
+
+
+# Per-script argument builders; only the one for the requested script is run
+PARSER_BUILDERS = {
+    "file-reader": _build_file_reader_parser,
+    "workflow-dispatch": _build_workflow_dispatch_parser,
+    "workflow-status": _build_workflow_status_parser,
+    "workflow-list": _build_workflow_list_parser,
+    "workflow-status-all": _build_workflow_status_all_parser,
+}
+
+
 def main():
+    argv = sys.argv[1:]
+
+    # Handle --list before building any parser
+    if "--list" in argv or "-l" in argv:
+        list_scripts()
+        return 0
+
     parser = argparse.ArgumentParser(
         description="Run local automation scripts (no API required)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -82,16 +238,19 @@ Examples:
 
   # Trigger with custom parameters
   python run.py workflow-dispatch --project test --param message="Hello!"
+
+  # Trigger several projects and wait for all of them
+  python run.py workflow-dispatch --project test,choice-test
+
+  # Check the last run of several projects
+  python run.py workflow-status --project test,choice-test
+
+  # Trigger without waiting and print the result as JSON
+  python run.py workflow-dispatch --project test --no-wait --json
 """,
     )
 
     # Global arguments
-    parser.add_argument(
-        "script",
-        nargs="?",
-        choices=list(SCRIPTS.keys()),
-        help="Script to run",
-    )
     parser.add_argument(
         "--list", "-l",
         action="store_true",
@@ -102,105 +261,51 @@ Examples:
         action="store_true",
         help="Show detailed output (full file contents, full logs)",
     )
-
-    # File reader arguments
-    parser.add_argument(
-        "--path",
-        default=".",
-        help="Directory path for file-reader (default: current directory)",
-    )
-    parser.add_argument(
-        "--pattern",
-        default="*",
-        help="File pattern for file-reader (default: *)",
-    )
-
-    # Workflow dispatch arguments
     parser.add_argument(
-        "--project",
-        help="Project name from projects.yaml (for workflow-dispatch)",
-    )
-    parser.add_argument(
-        "--workflow",
-        help="Override workflow file name",
-    )
-    parser.add_argument(
-        "--branch",
-        help="Override branch name",
-    )
-    parser.add_argument(
-        "--param",
-        action="append",
-        dest="params",
-        metavar="KEY=VALUE",
-        help="Workflow parameter (can be repeated)",
-    )
-    parser.add_argument(
-        "--no-wait",
+        "--json",
         action="store_true",
-        help="Don't wait for workflow completion (workflow-dispatch only)",
+        help="Print the result as JSON instead of formatted output",
     )
 
-    args = parser.parse_args()
-
-    # Handle --list
-    if args.list:
-        list_scripts()
-        return 0
+    # Only the requested script's arguments are registered
+    requested = next((arg for arg in argv if arg in SCRIPTS), None)
+    subparsers = parser.add_subparsers(dest="script", help="Script to run")
+    for name, spec in SCRIPTS.items():
+        subparser = subparsers.add_parser(name, help=spec.description, description=spec.description)
+        if name == requested:
+            subparser.add_argument(
+                "--verbose", "-v",
+                action="store_true",
+                default=argparse.SUPPRESS,
+                help="Show detailed output (full file contents, full logs)",
+            )
+            subparser.add_argument(
+                "--json",
+                action="store_true",
+                default=argparse.SUPPRESS,
+                help="Print the result as JSON instead of formatted output",
+            )
+            # Scripts without a builder take only the common arguments
+            subparser.set_defaults(build_kwargs=lambda args: {})
+            builder = PARSER_BUILDERS.get(name)
+            if builder:
+                builder(subparser)
+
+    args = parser.parse_args(argv)
 
     # Require a script name
     if not args.script:
+        console = get_console()
         console.print("[yellow]No script specified. Use --list to see available scripts.[/yellow]")
         console.print()
         list_scripts()
         return 1
 
-    # Build kwargs based on script type
-    kwargs = {}
-
-    if args.script == "file-reader":
-        kwargs["path"] = args.path
-        kwargs["pattern"] = args.pattern
-
-    elif args.script == "workflow-dispatch":
-        if not args.project:
-            console.print("[red]Error: --project is required for workflow-dispatch[/red]")
-            console.print("[dim]Example: python run.py workflow-dispatch --project test[/dim]")
-            return 1
-
-        kwargs["project"] = args.project
-        kwargs["wait"] = not args.no_wait
-
-        if args.workflow:
-            kwargs["workflow"] = args.workflow
-        if args.branch:
-            kwargs["branch"] = args.branch
-        if args.params:
-            kwargs["params"] = args.params
-
-    elif args.script == "workflow-status":
-        if not args.project:
-            console.print("[red]Error: --project is required for workflow-status[/red]")
-            console.print("[dim]Example: python run.py workflow-status --project test[/dim]")
-            return 1
-
-        kwargs["project"] = args.project
-        if args.workflow:
-            kwargs["workflow"] = args.workflow
-
-    elif args.script == "workflow-list":
-        if not args.project:
-            console.print("[red]Error: --project is required for workflow-list[/red]")
-            console.print("[dim]Example: python run.py workflow-list --project test[/dim]")
-            return 1
-
-        kwargs["project"] = args.project
-
-    elif args.script == "workflow-status-all":
-        # No additional arguments needed
-        pass
+    kwargs = args.build_kwargs(args)
+    if kwargs is None:
+        return 1
 
-    return run_script(args.script, verbose=args.verbose, **kwargs)
+    return run_script(args.script, verbose=args.verbose, json_output=args.json, **kwargs)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,64 @@
 """Scripts package - collection of local automation scripts."""
 
+import importlib
+from typing import Dict, NamedTuple, Type
+
 from scripts.base import BaseScript, ScriptConfig, ScriptResult
-from scripts.file_reader import FileReaderScript
-from scripts.workflow_dispatch import WorkflowDispatchScript
-from scripts.workflow_status import WorkflowStatusScript
-from scripts.workflow_list import WorkflowListScript
-from scripts.workflow_status_all import WorkflowStatusAllScript
-
-# Registry of available scripts
-SCRIPTS = {
-    "file-reader": FileReaderScript,
-    "workflow-dispatch": WorkflowDispatchScript,
-    "workflow-status": WorkflowStatusScript,
-    "workflow-list": WorkflowListScript,
-    "workflow-status-all": WorkflowStatusAllScript,
+
+
+class ScriptSpec(NamedTuple):
+    """Registry entry: where a script lives, plus the details shown by --list."""
+    module: str
+    attr: str
+    description: str
+    version: str
+
+
+# Registry of available scripts. Script modules are only imported when a
+# script is actually dispatched; description and version must match the
+# script's ScriptConfig.
+SCRIPTS: Dict[str, ScriptSpec] = {
+    "file-reader": ScriptSpec(
+        "scripts.file_reader", "FileReaderScript",
+        "Read and display files matching a glob pattern", "1.0.0",
+    ),
+    "workflow-dispatch": ScriptSpec(
+        "scripts.workflow_dispatch", "WorkflowDispatchScript",
+        "Trigger GitHub Actions workflows and monitor status", "1.0.0",
+    ),
+    "workflow-status": ScriptSpec(
+        "scripts.workflow_status", "WorkflowStatusScript",
+        "Check status of last workflow run", "1.0.0",
+    ),
+    "workflow-list": ScriptSpec(
+        "scripts.workflow_list", "WorkflowListScript",
+        "List available workflows and their input options", "1.0.0",
+    ),
+    "workflow-status-all": ScriptSpec(
+        "scripts.workflow_status_all", "WorkflowStatusAllScript",
+        "Check status of all configured projects", "1.0.0",
+    ),
 }
 
+_CLASS_MODULES = {spec.attr: spec.module for spec in SCRIPTS.values()}
+_loaded: Dict[str, Type[BaseScript]] = {}
+
+
+def load_script(name: str) -> Type[BaseScript]:
+    """Import and return the script class registered under the given name."""
+    if name not in _loaded:
+        spec = SCRIPTS[name]
+        _loaded[name] = getattr(importlib.import_module(spec.module), spec.attr)
+    return _loaded[name]
+
+
+def __getattr__(name: str):
+    """Resolve script classes on first access (e.g. `from scripts import FileReaderScript`)."""
+    if name in _CLASS_MODULES:
+        return getattr(importlib.import_module(_CLASS_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BaseScript",
     "ScriptConfig",
@@ -26,4 +69,6 @@ __all__ = [
     "WorkflowListScript",
     "WorkflowStatusAllScript",
     "SCRIPTS",
+    "ScriptSpec",
+    "load_script",
 ]
@@ -0,0 +1,68 @@
+"""In-process memoization and JSON cache files shared by the workflow scripts."""
+
+import asyncio
+import functools
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+
+def load_json_cache(path: Path) -> Dict[str, Any]:
+    """Load a JSON cache file, or an empty dict if it's missing or invalid."""
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_json_cache(path: Path, cache: Dict[str, Any]) -> None:
+    """Write a JSON cache file, replacing it atomically."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def async_ttl_cache(maxsize: int = 128, ttl: float = 300):
+    """
+    Memoize an async method on its arguments (excluding self) for `ttl` seconds.
+    Concurrent calls with the same arguments share one call; calls that raise
+    aren't cached. The wrapped method gets a cache_clear() to drop all entries.
+    """
+    def decorator(func):
+        cache: "OrderedDict[tuple, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+        @functools.wraps(func)
+        async def wrapper(self, *args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is not None and entry[0] > now and not entry[1].cancelled():
+                cache.move_to_end(args)
+                return await asyncio.shield(entry[1])
+
+            task = asyncio.ensure_future(func(self, *args))
+            cache[args] = (now + ttl, task)
+            cache.move_to_end(args)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+
+            try:
+                return await asyncio.shield(task)
+            except Exception:
+                if cache.get(args, (0, None))[1] is task:
+                    del cache[args]
+                raise
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
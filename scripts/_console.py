@@ -0,0 +1,16 @@
+"""Shared rich console for all scripts."""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Return the process-wide console, importing rich on first use."""
+    from rich.console import Console
+
+    # Markup is used for styling; repr highlighting of plain output is not
+    return Console(highlight=False, markup=True)
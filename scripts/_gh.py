@@ -0,0 +1,103 @@
+"""Shared location of the GitHub CLI binary, and helpers for its API output."""
+
+import asyncio
+import shutil
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from scripts._console import get_console
+
+# Absolute path of gh, resolved once so subprocess calls skip the PATH search.
+# gh is started with an argv list and without preexec_fn, start_new_session or
+# process_group, which keeps CPython's vfork() launch on Linux: spawning costs
+# the same however large this process's memory gets.
+GH_BIN = shutil.which("gh") or "gh"
+
+
+def parse_api_response(output: str) -> Tuple[int, Dict[str, str], str]:
+    """
+    Split the output of `gh api -i` into (HTTP status, lower-cased headers, body).
+    Status is 0 if the output has no status line.
+    """
+    head, _, body = output.replace("\r\n", "\n").partition("\n\n")
+    lines = head.split("\n")
+    try:
+        status = int(lines[0].split()[1])
+    except (IndexError, ValueError):
+        return 0, {}, ""
+
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+async def gh_api(gh: Callable[..., Awaitable[Tuple[Any, ...]]], rate_limit: "RateLimit", endpoint: str,
+                 etag: Optional[str] = None, jq: Optional[str] = None) -> Tuple[int, Dict[str, str], str]:
+    """
+    Call the GitHub REST API through gh, as a conditional request if an ETag is given.
+    `gh` runs the CLI with the given arguments and returns (returncode, stdout, ...),
+    stdout as str or bytes; the response's rate limit is recorded in `rate_limit`.
+    A jq filter, if given, is applied to the body by gh before it is returned.
+    Returns (HTTP status, lower-cased headers, body); status is 0 if no response was read.
+    """
+    args = ("api", "-i", endpoint)
+    if etag:
+        args += ("-H", f"If-None-Match: {etag}")
+    if jq:
+        args += ("--jq", jq)
+
+    # gh exits non-zero on 304, but still prints the response headers
+    stdout = (await gh(*args))[1]
+    if isinstance(stdout, bytes):
+        stdout = stdout.decode()
+    status, headers, body = parse_api_response(stdout)
+    rate_limit.update(headers)
+    return status, headers, body
+
+
+class RateLimit:
+    """
+    The REST API rate limit as of the last `gh api -i` response, for holding
+    off calls while fewer than `reserve` requests remain.
+    """
+
+    def __init__(self, reserve: int):
+        self.reserve = reserve
+        self._remaining: Optional[int] = None
+        self._reset = 0.0
+        # Reset time of the last wait announced, so concurrent waits print once
+        self._announced_reset: Optional[float] = None
+
+    def update(self, headers: Dict[str, str]) -> None:
+        """Record the limit from a response's lower-cased headers, if present."""
+        if "x-ratelimit-remaining" not in headers:
+            return
+        try:
+            self._remaining = int(headers["x-ratelimit-remaining"])
+            self._reset = float(headers.get("x-ratelimit-reset", 0))
+        except ValueError:
+            pass
+
+    def delay(self) -> float:
+        """Seconds to hold off API calls when the rate limit is nearly used up."""
+        if self._remaining is None or self._remaining > self.reserve:
+            return 0
+        return max(0.0, self._reset - time.time())
+
+    async def wait(self, limit: Optional[float] = None) -> None:
+        """Sleep until the rate limit resets, if it's nearly used up, but at most `limit` seconds."""
+        delay = self.delay()
+        if limit is not None:
+            delay = min(delay, max(0.0, limit))
+        if not delay:
+            return
+
+        if self._announced_reset != self._reset:
+            self._announced_reset = self._reset
+            get_console().print(
+                f"[dim]GitHub API rate limit nearly used up ({self._remaining} requests left, resets at "
+                f"{time.strftime('%H:%M', time.localtime(self._reset))}), waiting {delay:.0f}s...[/dim]"
+            )
+        await asyncio.sleep(delay)
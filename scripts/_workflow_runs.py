@@ -0,0 +1,93 @@
+"""Batched lookup of workflow runs, shared by the workflow status scripts."""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from scripts._cache import load_json_cache, save_json_cache
+from scripts._gh import GH_BIN
+
+
+# Fetches the latest runs of several workflows (by GraphQL node ID) in one request
+LATEST_RUNS_QUERY = """
+query($ids: [ID!]!, $first: Int!) {
+  nodes(ids: $ids) {
+    ... on Workflow {
+      runs(first: $first, orderBy: {field: CREATED_AT, direction: DESC}) {
+        nodes {
+          databaseId url createdAt updatedAt event
+          workflow { name }
+          checkSuite { status conclusion branch { name } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# GraphQL node IDs of workflows, which don't change, kept between invocations
+WORKFLOW_IDS_PATH = Path.home() / ".cache" / "agents" / "workflow_ids.json"
+
+
+def load_workflow_ids() -> Dict[str, str]:
+    """Load the "repo|workflow" -> node ID map of workflows looked up before."""
+    return load_json_cache(WORKFLOW_IDS_PATH)
+
+
+def save_workflow_ids(ids: Dict[str, str]) -> None:
+    """Write the workflow node ID map, replacing the file atomically."""
+    save_json_cache(WORKFLOW_IDS_PATH, ids)
+
+
+def get_workflow_node_id(repo: str, workflow: str) -> Optional[str]:
+    """Get a workflow's GraphQL node ID from its file name (or numeric ID)."""
+    cmd = [GH_BIN, "api", f"repos/{repo}/actions/workflows/{workflow}", "--jq", ".node_id"]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            return result.stdout.strip() or None
+    except Exception:
+        pass
+
+    return None
+
+
+def run_info_from_node(repo: str, run: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a WorkflowRun from LATEST_RUNS_QUERY to the fields `gh run list --json` gives."""
+    check_suite = run.get("checkSuite") or {}
+    run_id = str(run["databaseId"])
+    return {
+        "databaseId": run["databaseId"],
+        "id": run_id,
+        "status": (check_suite.get("status") or "").lower(),
+        "conclusion": (check_suite.get("conclusion") or "").lower(),
+        "createdAt": run.get("createdAt", ""),
+        "updatedAt": run.get("updatedAt", ""),
+        "headBranch": (check_suite.get("branch") or {}).get("name", ""),
+        "event": run.get("event", ""),
+        "name": (run.get("workflow") or {}).get("name", ""),
+        "url": run.get("url") or f"https://github.com/{repo}/actions/runs/{run_id}"
+    }
+
+
+def run_info_from_json(repo: str, run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fill in a run in `gh run list --json` fields to the same keys and empty
+    values run_info_from_node() gives.
+    """
+    run_id = str(run["databaseId"])
+    return {
+        "databaseId": run["databaseId"],
+        "id": run_id,
+        "status": run.get("status") or "",
+        "conclusion": run.get("conclusion") or "",
+        "createdAt": run.get("createdAt") or "",
+        "updatedAt": run.get("updatedAt") or "",
+        "headBranch": run.get("headBranch") or "",
+        "event": run.get("event") or "",
+        "name": run.get("name") or "",
+        "url": run.get("url") or f"https://github.com/{repo}/actions/runs/{run_id}"
+    }
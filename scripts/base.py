@@ -1,11 +1,67 @@
 """Base class for all scripts in the framework."""
 
+import functools
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import IO, Any, ClassVar, Dict, List, Optional, Union
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _yaml_loader() -> type:
+    """PyYAML's safe loader, using the libyaml C parser when available."""
+    import yaml
+
+    try:
+        return yaml.CSafeLoader
+    except AttributeError:
+        return yaml.SafeLoader
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Parse YAML like yaml.safe_load, but with the C parser when PyYAML has it."""
+    import yaml
+
+    return yaml.load(stream, Loader=_yaml_loader())
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_file_cached(path: str, mtime_ns: int) -> Any:
+    with open(path) as f:
+        return load_yaml(f)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the result while the file's mtime is unchanged,
+    so config files are parsed once per process.
+    """
+    return _load_yaml_file_cached(str(path), path.stat().st_mtime_ns)
+
+
+def find_config_file(name: str) -> Optional[Path]:
+    """
+    Find a config file: the path in RUNLOCAL_<NAME> (e.g. RUNLOCAL_PROJECTS_YAML
+    for projects.yaml) if set, otherwise the first of ./name, /app/name and
+    ~/.config/agents/name that exists.
+    """
+    override = os.environ.get("RUNLOCAL_" + name.upper().replace(".", "_"))
+    if override:
+        return Path(override)
+    return _search_config_file(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _search_config_file(name: str) -> Optional[Path]:
+    """The search in find_config_file, done once per process."""
+    for config_path in (Path(name), Path("/app") / name, Path.home() / ".config" / "agents" / name):
+        if config_path.exists():
+            return config_path
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class ScriptConfig:
     """Configuration for a script."""
     name: str
@@ -13,7 +69,7 @@ class ScriptConfig:
     version: str = "1.0.0"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScriptResult:
     """Standard result format for script execution."""
     success: bool
@@ -36,6 +92,16 @@ class BaseScript(ABC):
 
     config: ScriptConfig
 
+    # Shared instances, one per script class
+    _instances: ClassVar[Dict[type, "BaseScript"]] = {}
+
+    @classmethod
+    def get_instance(cls) -> "BaseScript":
+        """Get the shared instance of this script, creating it on first use."""
+        if cls not in BaseScript._instances:
+            BaseScript._instances[cls] = cls()
+        return BaseScript._instances[cls]
+
     @abstractmethod
     def run(self, verbose: bool = False, **kwargs) -> ScriptResult:
         """
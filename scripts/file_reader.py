@@ -1,16 +1,80 @@
 """File reader script - reads and displays files matching a pattern."""
 
+import codecs
+import fnmatch
+import functools
+import glob
 import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
-
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 
+from scripts._console import get_console
 from scripts.base import BaseScript, ScriptConfig, ScriptResult
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
+
+# (path, name, size, extension) for each matched file
+FileEntry = Tuple[str, str, int, str]
+
+# File extension -> language for syntax highlighting
+_EXT_TO_LANG = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".md": "markdown",
+    ".sh": "bash",
+    ".html": "html",
+    ".css": "css",
+    ".sql": "sql",
+    ".php": "php",
+    ".xml": "xml",
+}
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Bytes inspected to detect binary files before reading them fully
+_SNIFF_SIZE = 4096
+
+
+def _is_binary_header(header: bytes) -> bool:
+    """Check whether the start of a file looks binary (NUL bytes or invalid UTF-8)."""
+    if b"\x00" in header:
+        return True
+    try:
+        # Incremental decoding tolerates a character cut off at the end
+        codecs.getincrementaldecoder("utf-8")().decode(header)
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+def _count_lines(data: bytes) -> int:
+    """
+    Count lines without splitting the content into a list. Like splitlines(),
+    "\n", "\r\n" and a lone "\r" all end a line.
+    """
+    if not data:
+        return 0
+    endings = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+    return endings + (not data.endswith((b"\n", b"\r")))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob pattern into a regex matching file names."""
+    return re.compile(fnmatch.translate(pattern))
+
 
 class FileReaderScript(BaseScript):
     """Script to read and display files matching a glob pattern."""
@@ -21,8 +85,10 @@ class FileReaderScript(BaseScript):
         version="1.0.0"
     )
 
-    def __init__(self):
-        self.console = Console()
+    @property
+    def console(self) -> "Console":
+        """Shared console for output."""
+        return get_console()
 
     def run(self, verbose: bool = False, **kwargs) -> ScriptResult:
         """
@@ -32,12 +98,14 @@ class FileReaderScript(BaseScript):
             verbose: If True, show full file contents
             path: Directory to search in (default: current directory)
             pattern: Glob pattern to match files (default: "*")
+            sort: If True, order files by path (default: directory order)
 
         Returns:
             ScriptResult with list of files and their contents
         """
         path = kwargs.get("path", ".")
         pattern = kwargs.get("pattern", "*")
+        sort = kwargs.get("sort", False)
 
         base_path = Path(path)
         if not base_path.exists():
@@ -65,6 +133,9 @@ class FileReaderScript(BaseScript):
                 data={"files": [], "count": 0}
             )
 
+        if sort:
+            files.sort(key=itemgetter(0))
+
         # Display results
         file_data = self._process_files(files, verbose)
 
@@ -74,118 +145,155 @@ class FileReaderScript(BaseScript):
             data={"files": file_data, "count": len(files)}
         )
 
-    def _find_files(self, base_path: Path, pattern: str) -> List[Path]:
+    def _find_files(self, base_path: Path, pattern: str) -> List[FileEntry]:
         """Find all files matching the pattern."""
+        if not glob.has_magic(pattern):
+            # Literal file name, no need to scan the directory
+            entry = self._stat_entry(base_path / pattern)
+            return [entry] if entry else []
+
+        if "/" in pattern or "**" in pattern:
+            return self._glob_files(base_path, pattern)
+
+        # "*" (the default) matches every name
+        match = None if pattern == "*" else _compile_pattern(pattern).match
+
+        # Paths are built as Path.glob() gives them: "foo.py" rather than
+        # "./foo.py" for the current directory
+        base = str(base_path)
+        prefix = "" if base == "." else os.path.join(base, "")
+
+        # DirEntry caches file type and stat info from the directory scan
+        files = []
+        append = files.append
+        splitext = os.path.splitext
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if (match is None or match(name)) and entry.is_file():
+                    append((prefix + name, name, entry.stat().st_size, splitext(name)[1]))
+        return files
+
+    def _glob_files(self, base_path: Path, pattern: str) -> List[FileEntry]:
+        """Find files for patterns that span directories."""
         files = []
         for file_path in base_path.glob(pattern):
-            if file_path.is_file():
-                files.append(file_path)
-        return sorted(files)
+            entry = self._stat_entry(file_path)
+            if entry:
+                files.append(entry)
+        return files
+
+    def _stat_entry(self, file_path: Path) -> Optional[FileEntry]:
+        """Build a file entry with a single stat, or None if not a regular file."""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return (str(file_path), file_path.name, st.st_size, file_path.suffix)
 
-    def _process_files(self, files: List[Path], verbose: bool) -> List[Dict[str, Any]]:
+    def _process_files(self, files: List[FileEntry], verbose: bool) -> List[Dict[str, Any]]:
         """Process and display files."""
         file_data = []
 
         if verbose:
-            # Show full file contents
-            for file_path in files:
-                file_info = self._read_file(file_path)
-                file_data.append(file_info)
-                self._display_file_content(file_path, file_info)
+            from rich.console import Group
+
+            # Read files concurrently; rendering stays on this thread
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                file_data = list(executor.map(self._read_file, files))
+
+            # Show full file contents, rendered in a single print
+            panels = [self._build_file_panel(file_info) for file_info in file_data]
+            self.console.print(Group(*panels))
         else:
-            # Show summary table
-            self._display_file_table(files)
-            for file_path in files:
-                file_data.append({
-                    "path": str(file_path),
-                    "name": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "extension": file_path.suffix
+            # Show summary table, filling rows and result data in one pass
+            table = self._build_file_table()
+            add_row = table.add_row
+            append = file_data.append
+            format_size = self._format_size
+            dirname = os.path.dirname
+            for path, name, size, extension in files:
+                add_row(name, format_size(size), extension or "-", dirname(path) or ".")
+                append({
+                    "path": path,
+                    "name": name,
+                    "size": size,
+                    "extension": extension
                 })
+            self.console.print(table)
 
         return file_data
 
-    def _read_file(self, file_path: Path) -> Dict[str, Any]:
+    def _read_file(self, entry: FileEntry) -> Dict[str, Any]:
         """Read a single file and return its info."""
+        path, name, size, extension = entry
         try:
-            content = file_path.read_text(encoding="utf-8")
-            return {
-                "path": str(file_path),
-                "name": file_path.name,
-                "size": file_path.stat().st_size,
-                "extension": file_path.suffix,
-                "content": content,
-                "lines": len(content.splitlines()),
-                "error": None
-            }
+            with open(path, "rb") as f:
+                # Only read the rest of the file if its start looks like text
+                header = f.read(_SNIFF_SIZE)
+                if not _is_binary_header(header):
+                    data = header + f.read()
+                    content = data.decode("utf-8")
+                    return {
+                        "path": path,
+                        "name": name,
+                        "size": size,
+                        "extension": extension,
+                        "content": content,
+                        "lines": _count_lines(data),
+                        "error": None
+                    }
         except UnicodeDecodeError:
-            return {
-                "path": str(file_path),
-                "name": file_path.name,
-                "size": file_path.stat().st_size,
-                "extension": file_path.suffix,
-                "content": None,
-                "lines": 0,
-                "error": "Binary file or encoding error"
-            }
+            pass
         except Exception as e:
             return {
-                "path": str(file_path),
-                "name": file_path.name,
+                "path": path,
+                "name": name,
                 "size": 0,
-                "extension": file_path.suffix,
+                "extension": extension,
                 "content": None,
                 "lines": 0,
                 "error": str(e)
             }
 
-    def _display_file_table(self, files: List[Path]) -> None:
-        """Display files in a summary table."""
+        return {
+            "path": path,
+            "name": name,
+            "size": size,
+            "extension": extension,
+            "content": None,
+            "lines": 0,
+            "error": "Binary file or encoding error"
+        }
+
+    def _build_file_table(self) -> "Table":
+        """Create the empty summary table."""
+        from rich.table import Table
+
         table = Table(title="Files Found")
         table.add_column("Name", style="cyan")
         table.add_column("Size", justify="right", style="green")
         table.add_column("Extension", style="yellow")
         table.add_column("Path", style="dim")
+        return table
 
-        for file_path in files:
-            size = file_path.stat().st_size
-            size_str = self._format_size(size)
-            table.add_row(
-                file_path.name,
-                size_str,
-                file_path.suffix or "-",
-                str(file_path.parent)
-            )
+    def _build_file_panel(self, file_info: Dict[str, Any]) -> "Panel":
+        """Build a panel showing full file content with syntax highlighting."""
+        from rich.panel import Panel
+        from rich.syntax import Syntax
 
-        self.console.print(table)
-
-    def _display_file_content(self, file_path: Path, file_info: Dict[str, Any]) -> None:
-        """Display full file content with syntax highlighting."""
         if file_info["error"]:
-            self.console.print(Panel(
+            return Panel(
                 f"[red]Error: {file_info['error']}[/red]",
-                title=f"[bold]{file_path.name}[/bold]",
+                title=f"[bold]{file_info['name']}[/bold]",
                 subtitle=f"Size: {self._format_size(file_info['size'])}"
-            ))
-            return
+            )
 
         # Try to determine language for syntax highlighting
-        ext_to_lang = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".json": "json",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".md": "markdown",
-            ".sh": "bash",
-            ".html": "html",
-            ".css": "css",
-            ".sql": "sql",
-            ".php": "php",
-            ".xml": "xml",
-        }
-        lang = ext_to_lang.get(file_path.suffix.lower(), "text")
+        lang = _EXT_TO_LANG.get(file_info["extension"].lower(), "text")
 
         syntax = Syntax(
             file_info["content"],
@@ -195,16 +303,18 @@ class FileReaderScript(BaseScript):
             word_wrap=True
         )
 
-        self.console.print(Panel(
+        return Panel(
             syntax,
-            title=f"[bold cyan]{file_path.name}[/bold cyan]",
+            title=f"[bold cyan]{file_info['name']}[/bold cyan]",
             subtitle=f"Lines: {file_info['lines']} | Size: {self._format_size(file_info['size'])}"
-        ))
+        )
 
-    def _format_size(self, size: int) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_size(size: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        if size < 1024:
+            return f"{size} B"
+        # Each unit step is 10 bits (1024x)
+        exp = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (exp * 10)):.1f} {_SIZE_UNITS[exp]}"
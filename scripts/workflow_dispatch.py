@@ -1,18 +1,94 @@
 """GitHub Actions workflow dispatch script - triggers and monitors workflows."""
 
+import asyncio
+import functools
+import hashlib
+import hmac
 import json
-import subprocess
-import sys
+import os
+import random
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import quote
 
-import yaml
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from scripts._cache import async_ttl_cache, load_json_cache, save_json_cache
+from scripts._console import get_console
+from scripts._gh import GH_BIN, RateLimit, gh_api
+from scripts.base import BaseScript, ScriptConfig, ScriptResult, load_yaml, load_yaml_file, find_config_file
 
-from scripts.base import BaseScript, ScriptConfig, ScriptResult
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Fetches status for several workflow runs (by GraphQL node ID) in one request
+_RUN_STATUSES_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on WorkflowRun {
+      databaseId url createdAt updatedAt
+      workflow { name }
+      checkSuite { status conclusion }
+    }
+  }
+}
+"""
+
+
+# Conclusion -> (style, label) for the result display
+_STATUS_STYLES = {
+    "success": ("green", "SUCCESS"),
+    "failure": ("red", "FAILURE"),
+    "cancelled": ("yellow", "CANCELLED"),
+}
+
+
+# Runs being waited on, so an interrupted wait can resume instead of re-triggering
+RUN_STATE_PATH = Path.home() / ".cache" / "agents" / "runs.json"
+
+
+def _gh_hosts_file() -> Path:
+    """Path of gh's hosts.yml, where `gh auth login` stores credentials."""
+    if os.environ.get("GH_CONFIG_DIR"):
+        config_dir = Path(os.environ["GH_CONFIG_DIR"])
+    elif os.environ.get("XDG_CONFIG_HOME"):
+        config_dir = Path(os.environ["XDG_CONFIG_HOME"]) / "gh"
+    else:
+        config_dir = Path.home() / ".config" / "gh"
+    return config_dir / "hosts.yml"
+
+
+def _run_state_key(repo: str, workflow: str, branch: str, params: Dict[str, str]) -> str:
+    """Identify a dispatch by its repo, workflow, branch and parameters."""
+    key = f"{repo}|{workflow}|{branch}|{sorted(params.items())}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _load_run_state() -> Dict[str, str]:
+    """Load the state_key -> run_id map of runs being waited on."""
+    return load_json_cache(RUN_STATE_PATH)
+
+
+def _update_run_state(state_key: str, run_id: Optional[str]) -> None:
+    """Record (or with run_id None, forget) the run being waited on for state_key."""
+    state = _load_run_state()
+    if run_id:
+        state[state_key] = run_id
+    elif state.pop(state_key, None) is None:
+        return
+
+    save_json_cache(RUN_STATE_PATH, state)
+
+
+# Fields of a workflow run that status checks use; gh drops the rest of the
+# (several KB) response before it reaches us
+_RUN_STATUS_FIELDS = "{id, node_id, status, conclusion, html_url, name, created_at, updated_at}"
+
+
+@functools.lru_cache(maxsize=64)
+def _run_endpoint(repo: str, run_id: str) -> str:
+    """REST endpoint for a workflow run, built once per run rather than per poll."""
+    return f"repos/{repo}/actions/runs/{run_id}"
 
 
 class WorkflowDispatchScript(BaseScript):
@@ -28,29 +104,70 @@ class WorkflowDispatchScript(BaseScript):
     DEFAULT_POLL_INTERVAL = 30
     DEFAULT_TIMEOUT = 3600
     DEFAULT_SHOW_PROGRESS = True
+    # Only local forwarders (e.g. a tunnel client) can reach the webhook listener by default
+    DEFAULT_WEBHOOK_HOST = "127.0.0.1"
+
+    # Polling starts at this delay and backs off up to poll_interval
+    INITIAL_POLL_DELAY = 2
+    POLL_BACKOFF = 2
+
+    # How long, and how often, to look for a newly triggered run
+    RUN_CREATE_TIMEOUT = 10
+    RUN_CREATE_POLL_INTERVAL = 0.2
+    RUN_CREATE_MAX_POLL_INTERVAL = 2
+    # Allowance for the local clock being ahead of GitHub's
+    RUN_CREATE_CLOCK_SKEW = 60
+
+    # Polling waits for the rate limit reset once this few REST requests remain
+    RATE_LIMIT_RESERVE = 10
+
+    # Logs beyond this size are cut off
+    MAX_LOG_BYTES = 15000
+
+    # Webhook connections are dropped if a delivery takes longer to read, or
+    # has a larger body, than this
+    WEBHOOK_READ_TIMEOUT = 10
+    MAX_WEBHOOK_BODY = 1024 * 1024
+
+    @property
+    def console(self) -> "Console":
+        """Shared console for output."""
+        return get_console()
 
     def __init__(self):
-        self.console = Console()
         self.projects_config: Dict[str, Any] = {}
         self.script_config: Dict[str, Any] = {}
+        # run_id -> (ETag, status info) of the last status response
+        self._run_status_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # run_id -> GraphQL node ID, for batched status queries
+        self._run_node_ids: Dict[str, str] = {}
+        # Run IDs already returned by a trigger, which no other trigger may claim
+        self._claimed_run_ids: Set[str] = set()
+        # From the last REST API response
+        self._rate_limit = RateLimit(self.RATE_LIMIT_RESERVE)
+        # Cached result of _check_gh_auth
+        self._auth_ok: Optional[bool] = None
+        # run_id -> log fetch started when the run was seen to complete
+        self._log_fetches: Dict[str, "asyncio.Task[Tuple[str, bool]]"] = {}
+        # Set per run: only return results, without progress or result display
+        self._quiet = False
+        # Webhook listener shared by every wait, and the runs it is waited on for
+        self._webhook_server: Optional[asyncio.AbstractServer] = None
+        self._webhook_waiters: Dict[str, asyncio.Future] = {}
+        # Open webhook connections and their handlers, closed along with the listener
+        self._webhook_connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
         self._load_script_config()
 
     def _load_script_config(self) -> None:
         """Load script configuration from config.yaml."""
-        config_paths = [
-            Path("config.yaml"),
-            Path("/app/config.yaml"),
-            Path.home() / ".config" / "agents" / "config.yaml"
-        ]
+        config_path = find_config_file("config.yaml")
+        if config_path is None:
+            return
 
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        self.script_config = yaml.safe_load(f) or {}
-                    return
-                except Exception:
-                    pass
+        try:
+            self.script_config = load_yaml_file(config_path) or {}
+        except Exception:
+            pass
 
     def _get_poll_interval(self) -> int:
         """Get poll interval from config."""
@@ -64,9 +181,17 @@ class WorkflowDispatchScript(BaseScript):
             "timeout", self.DEFAULT_TIMEOUT
         )
 
+    def _get_webhook_port(self) -> Optional[int]:
+        """Get the port to receive workflow_run webhooks on, if configured."""
+        return self.script_config.get("workflow", {}).get("webhook_port")
+
+    def _get_webhook_host(self) -> str:
+        """Get the address the webhook listener binds to from config."""
+        return self.script_config.get("workflow", {}).get("webhook_host", self.DEFAULT_WEBHOOK_HOST)
+
     def _get_show_progress(self) -> bool:
-        """Get show_progress setting from config."""
-        return self.script_config.get("workflow", {}).get(
+        """Get show_progress setting from config (always off when quiet)."""
+        return not self._quiet and self.script_config.get("workflow", {}).get(
             "show_progress", self.DEFAULT_SHOW_PROGRESS
         )
 
@@ -74,21 +199,32 @@ class WorkflowDispatchScript(BaseScript):
         """
         Trigger a workflow and wait for completion.
 
+        Runs run_async() on a new event loop; see it for the arguments.
+        """
+        return asyncio.run(self.run_async(verbose=verbose, **kwargs))
+
+    async def run_async(self, verbose: bool = False, **kwargs) -> ScriptResult:
+        """
+        Trigger a workflow and wait for completion.
+
         Args:
             verbose: If True, show full workflow logs
-            project: Project name from projects.yaml
+            project: Project name from projects.yaml, or a list of names
+                     to trigger and monitor together
             workflow: Override workflow file (optional)
             branch: Override branch (optional)
             params: Additional parameters as key=value pairs
             wait: Wait for workflow completion (default: True)
+            quiet: Don't show progress or results, only return them (default: False)
 
         Returns:
             ScriptResult with workflow run details
         """
         project = kwargs.get("project")
-        workflow_override = kwargs.get("workflow")
-        branch_override = kwargs.get("branch")
-        params = kwargs.get("params", [])
+        self._quiet = kwargs.get("quiet", False)
+        if isinstance(project, (list, tuple)):
+            return await self.run_many(list(project), verbose=verbose, **kwargs)
+
         wait = kwargs.get("wait", True)
 
         # Load projects configuration
@@ -100,47 +236,49 @@ class WorkflowDispatchScript(BaseScript):
             )
 
         # Get project configuration
-        if project not in self.projects_config.get("projects", {}):
+        settings = self._get_project_settings(project, kwargs)
+        if settings is None:
             available = list(self.projects_config.get("projects", {}).keys())
             return ScriptResult(
                 success=False,
                 message=f"Project '{project}' not found",
                 errors=[f"Available projects: {', '.join(available)}"]
             )
+        repo, workflow, branch, final_params = settings
 
-        project_cfg = self.projects_config["projects"][project]
-        repo = project_cfg["repo"]
-        workflow = workflow_override or project_cfg.get("workflow", "workflow.yaml")
-        branch = branch_override or project_cfg.get("branch", "main")
-        defaults = project_cfg.get("defaults", {})
-
-        # Merge default params with overrides
-        final_params = dict(defaults)
-        for param in params:
-            if "=" in param:
-                key, value = param.split("=", 1)
-                final_params[key] = value
-
-        # Check gh CLI authentication
-        if not self._check_gh_auth():
+        # Check gh CLI authentication while fetching the workflow's inputs
+        authenticated, _ = await asyncio.gather(
+            self._check_gh_auth(),
+            self._prefetch_workflow(repo, workflow, branch)
+        )
+        if not authenticated:
             return ScriptResult(
                 success=False,
                 message="GitHub CLI not authenticated",
                 errors=["Run 'gh auth login' to authenticate"]
             )
 
-        # Trigger the workflow (silent)
-        run_id = self._trigger_workflow(repo, workflow, branch, final_params)
-        if not run_id:
-            return ScriptResult(
-                success=False,
-                message="Failed to trigger workflow",
-                errors=["Check gh CLI output for details"]
-            )
+        # Attach to a run an interrupted invocation was still waiting for
+        state_key = _run_state_key(repo, workflow, branch, final_params)
+        run_id = await self._find_resumable_run(repo, state_key) if wait else None
+        if run_id:
+            self.console.print(f"[dim]Resuming workflow run {run_id}[/dim]")
+        else:
+            # Trigger the workflow (silent)
+            run_id = await self._trigger_workflow(repo, workflow, branch, final_params)
+            if not run_id:
+                return ScriptResult(
+                    success=False,
+                    message="Failed to trigger workflow",
+                    errors=["Check gh CLI output for details"]
+                )
+            if wait:
+                _update_run_state(state_key, run_id)
 
         if not wait:
             # Show immediate result for --no-wait
-            self._display_triggered(project, repo, workflow, branch, final_params, run_id)
+            if not self._quiet:
+                self._display_triggered(project, repo, workflow, branch, final_params, run_id)
             return ScriptResult(
                 success=True,
                 message="Workflow triggered (not waiting for completion)",
@@ -148,51 +286,210 @@ class WorkflowDispatchScript(BaseScript):
             )
 
         # Wait for completion silently, then show final result
-        final_status = self._wait_for_completion(repo, run_id, verbose)
+        final_status = await self._wait_for_completion(repo, run_id, verbose)
+        _update_run_state(state_key, None)
 
         # Display final result
-        self._display_final_result(
-            project, repo, workflow, branch, final_params,
-            run_id, final_status, verbose
-        )
+        if not self._quiet:
+            await self._display_final_result(
+                project, repo, workflow, branch, final_params,
+                run_id, final_status, verbose
+            )
 
         return final_status
 
+    async def run_many(self, projects: List[str], verbose: bool = False, **kwargs) -> ScriptResult:
+        """
+        Trigger workflows for several projects at once and wait for all of them.
+
+        All runs are triggered and monitored concurrently on the running event
+        loop; their statuses are polled together in one GraphQL request per poll.
+        Accepts the same keyword arguments as run_async() (other than project).
+
+        Returns:
+            ScriptResult with data["runs"] mapping each project to its run details
+        """
+        wait = kwargs.get("wait", True)
+        self._quiet = kwargs.get("quiet", False)
+
+        if not self._load_projects_config():
+            return ScriptResult(
+                success=False,
+                message="Failed to load projects.yaml",
+                errors=["projects.yaml not found or invalid"]
+            )
+
+        # A project listed twice is triggered once
+        projects = list(dict.fromkeys(projects))
+        settings = {}
+        for project in projects:
+            settings[project] = self._get_project_settings(project, kwargs)
+            if settings[project] is None:
+                available = list(self.projects_config.get("projects", {}).keys())
+                return ScriptResult(
+                    success=False,
+                    message=f"Project '{project}' not found",
+                    errors=[f"Available projects: {', '.join(available)}"]
+                )
+
+        authenticated, *_ = await asyncio.gather(
+            self._check_gh_auth(),
+            *(self._prefetch_workflow(repo, workflow, branch)
+              for repo, workflow, branch, _ in settings.values())
+        )
+        if not authenticated:
+            return ScriptResult(
+                success=False,
+                message="GitHub CLI not authenticated",
+                errors=["Run 'gh auth login' to authenticate"]
+            )
+
+        # List the existing runs of every workflow before any is triggered, so
+        # one project's new run isn't taken for an existing run of another's
+        targets = list(dict.fromkeys((repo, workflow, branch) for repo, workflow, branch, _ in settings.values()))
+        snapshots = dict(zip(targets, await asyncio.gather(*(
+            self._list_existing_runs(repo, workflow, branch) for repo, workflow, branch in targets
+        ))))
+
+        # Trigger all workflows concurrently
+        run_ids = await asyncio.gather(*(
+            self._trigger_workflow(repo, workflow, branch, params, snapshots[(repo, workflow, branch)])
+            for repo, workflow, branch, params in settings.values()
+        ))
+        triggered = {
+            project: run_id for project, run_id in zip(projects, run_ids) if run_id
+        }
+        errors = [f"{project}: failed to trigger workflow"
+                  for project in projects if project not in triggered]
+
+        if not wait:
+            if not self._quiet:
+                for project, run_id in triggered.items():
+                    repo, workflow, branch, params = settings[project]
+                    self._display_triggered(project, repo, workflow, branch, params, run_id)
+            return ScriptResult(
+                success=not errors,
+                message=f"Triggered {len(triggered)}/{len(projects)} workflow(s) (not waiting for completion)",
+                data={"runs": {
+                    project: {"run_id": run_id, "repo": settings[project][0], "workflow": settings[project][1]}
+                    for project, run_id in triggered.items()
+                }},
+                errors=errors
+            )
+
+        results = await self._wait_for_many(
+            {run_id: settings[project][0] for project, run_id in triggered.items()}, verbose
+        )
+
+        succeeded = 0
+        for project, run_id in triggered.items():
+            repo, workflow, branch, params = settings[project]
+            result = results[run_id]
+            if not self._quiet:
+                await self._display_final_result(
+                    project, repo, workflow, branch, params, run_id, result, verbose
+                )
+            if result.success:
+                succeeded += 1
+            else:
+                errors.append(f"{project}: {result.message}")
+
+        return ScriptResult(
+            success=not errors,
+            message=f"{succeeded}/{len(projects)} workflow(s) succeeded",
+            data={"runs": {project: results[run_id].data for project, run_id in triggered.items()}},
+            errors=errors
+        )
+
+    def _get_project_settings(self, project: str, kwargs: Dict[str, Any]) -> Optional[Tuple[str, str, str, Dict[str, str]]]:
+        """
+        Get (repo, workflow, branch, params) for a project, applying any overrides
+        from kwargs. Returns None if the project is not configured.
+        """
+        if project not in self.projects_config.get("projects", {}):
+            return None
+
+        project_cfg = self.projects_config["projects"][project]
+        repo = project_cfg["repo"]
+        workflow = kwargs.get("workflow") or project_cfg.get("workflow", "workflow.yaml")
+        branch = kwargs.get("branch") or project_cfg.get("branch", "main")
+        defaults = project_cfg.get("defaults", {})
+
+        # Merge default params with overrides
+        final_params = dict(defaults)
+        for param in kwargs.get("params", []):
+            if "=" in param:
+                key, value = param.split("=", 1)
+                final_params[key] = value
+
+        return repo, workflow, branch, final_params
+
     def _load_projects_config(self) -> bool:
         """Load projects configuration from yaml file."""
-        config_paths = [
-            Path("projects.yaml"),
-            Path("/app/projects.yaml"),
-            Path.home() / ".config" / "agents" / "projects.yaml"
-        ]
+        config_path = find_config_file("projects.yaml")
+        if config_path is None:
+            return False
 
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        self.projects_config = yaml.safe_load(f)
-                    return True
-                except Exception:
-                    return False
+        try:
+            self.projects_config = load_yaml_file(config_path)
+            return True
+        except Exception:
+            return False
 
-        return False
+    async def _gh(self, *args: str) -> Tuple[int, str, str]:
+        """Run a gh CLI command and return (returncode, stdout, stderr)."""
+        proc = await asyncio.create_subprocess_exec(
+            GH_BIN, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        return proc.returncode, stdout.decode(), stderr.decode()
 
-    def _check_gh_auth(self) -> bool:
-        """Check if gh CLI is authenticated."""
+    async def _gh_head(self, limit: int, *args: str) -> Tuple[str, bool]:
+        """
+        Run a gh CLI command and return (first `limit` bytes of stdout, truncated).
+        The rest of the output is never read; gh is killed once the limit is hit.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            GH_BIN, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
         try:
-            result = subprocess.run(
-                ["gh", "auth", "status"],
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+            data = await proc.stdout.readexactly(limit + 1)
+        except asyncio.IncompleteReadError as e:
+            data = e.partial
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
 
-    def _resolve_workflow_file(self, repo: str, workflow: str) -> Optional[str]:
+        return data[:limit].decode(errors="replace"), len(data) > limit
+
+    async def _check_gh_auth(self) -> bool:
+        """
+        Check if gh CLI is authenticated.
+        A token in the environment or a gh hosts file answers this without
+        running gh; the result is remembered for the life of the instance.
+        """
+        if self._auth_ok is None:
+            if os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN") or _gh_hosts_file().is_file():
+                self._auth_ok = True
+            else:
+                try:
+                    returncode, _, _ = await self._gh("auth", "status")
+                    self._auth_ok = returncode == 0
+                except FileNotFoundError:
+                    self._auth_ok = False
+        return self._auth_ok
+
+    @async_ttl_cache(maxsize=128, ttl=300)
+    async def _resolve_workflow_file(self, repo: str, workflow: str) -> Optional[str]:
         """
-        Resolve the correct workflow filename by trying both .yml and .yaml extensions.
-        Returns the resolved workflow name or None if not found.
+        Resolve the correct workflow filename by trying both .yml and .yaml extensions,
+        or by matching a workflow's display name.
+        Returns the resolved workflow name, or the given one if not found.
         """
         # If workflow already has extension, try it first then the alternative
         base_name = workflow.removesuffix('.yml').removesuffix('.yaml')
@@ -204,30 +501,36 @@ class WorkflowDispatchScript(BaseScript):
         elif workflow.endswith('.yaml'):
             extensions = ['.yaml', '.yml']
 
-        for ext in extensions:
-            test_workflow = base_name + ext
-            # Check if workflow exists by listing workflows
-            cmd = ["gh", "workflow", "list", "-R", repo, "--json", "name,path"]
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    workflows = json.loads(result.stdout)
-                    for wf in workflows:
-                        if wf.get("path", "").endswith(test_workflow):
-                            return test_workflow
-            except Exception:
-                pass
+        # List the repo's workflows once, then check each extension against it
+        try:
+            returncode, stdout, _ = await self._gh(
+                "workflow", "list", "-R", repo, "--json", "name,path"
+            )
+            if returncode == 0:
+                workflows = json.loads(stdout)
+                paths = [wf.get("path", "") for wf in workflows]
+                for ext in extensions:
+                    test_workflow = base_name + ext
+                    if any(path.endswith(test_workflow) for path in paths):
+                        return test_workflow
+
+                # `gh workflow run` also takes display names, but the REST
+                # runs endpoint needs the file name
+                for wf in workflows:
+                    if wf.get("name") == workflow and wf.get("path"):
+                        return wf["path"].rsplit("/", 1)[-1]
+        except Exception:
+            pass
 
         # Fallback to original workflow name
         return workflow
 
-    def _get_workflow_inputs(self, repo: str, workflow: str, branch: str = None) -> Dict[str, Any]:
+    @async_ttl_cache(maxsize=128, ttl=300)
+    async def _get_workflow_inputs(self, repo: str, workflow: str, branch: str = None) -> Dict[str, Any]:
         """
         Fetch allowed input values for a workflow from GitHub API.
         Returns a dict of input_name -> {type, options, default, required}.
         """
-        import base64
-
         try:
             # Construct the workflow path
             workflow_path = f".github/workflows/{workflow}"
@@ -237,17 +540,17 @@ class WorkflowDispatchScript(BaseScript):
             if branch:
                 api_url += f"?ref={branch}"
 
-            # Get workflow content directly
-            cmd = ["gh", "api", api_url, "--jq", ".content"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
+            # Get the raw workflow file rather than base64-encoded JSON
+            returncode, stdout, _ = await self._gh(
+                "api", api_url, "-H", "Accept: application/vnd.github.raw"
+            )
+            if returncode != 0:
                 return {}
 
-            if not result.stdout.strip():
+            if not stdout.strip():
                 return {}
 
-            content = base64.b64decode(result.stdout.strip()).decode('utf-8')
-            workflow_yaml = yaml.safe_load(content)
+            workflow_yaml = load_yaml(stdout)
 
             inputs = {}
             # Handle 'on' key - YAML parses 'on' as boolean True, so check both
@@ -263,9 +566,12 @@ class WorkflowDispatchScript(BaseScript):
 
             for name, config in dispatch_inputs.items():
                 if isinstance(config, dict):
+                    options = config.get("options", [])
                     inputs[name] = {
                         "type": config.get("type", "string"),
-                        "options": config.get("options", []),
+                        "options": options,
+                        # Lower-cased option -> option, for case-insensitive matching
+                        "options_lower": {str(opt).lower(): opt for opt in options},
                         "default": config.get("default"),
                         "required": config.get("required", False),
                         "description": config.get("description", "")
@@ -275,11 +581,11 @@ class WorkflowDispatchScript(BaseScript):
         except Exception as e:
             return {}
 
-    def _validate_and_fix_params(self, repo: str, workflow: str, branch: str, params: Dict[str, str]) -> Dict[str, str]:
+    async def _validate_and_fix_params(self, repo: str, workflow: str, branch: str, params: Dict[str, str]) -> Dict[str, str]:
         """
         Validate parameters against allowed values and fix case mismatches.
         """
-        inputs = self._get_workflow_inputs(repo, workflow, branch)
+        inputs = await self._get_workflow_inputs(repo, workflow, branch)
         if not inputs:
             return params  # Can't validate, pass through
 
@@ -289,7 +595,7 @@ class WorkflowDispatchScript(BaseScript):
                 allowed = inputs[key]["options"]
                 if value not in allowed:
                     # Try case-insensitive match
-                    match = next((opt for opt in allowed if opt.lower() == value.lower()), None)
+                    match = inputs[key]["options_lower"].get(value.lower())
                     if match:
                         self.console.print(f"[yellow]Warning: Correcting '{value}' to '{match}'[/yellow]")
                         fixed_params[key] = match
@@ -301,158 +607,552 @@ class WorkflowDispatchScript(BaseScript):
 
         return fixed_params
 
-    def _trigger_workflow(self, repo: str, workflow: str, branch: str,
-                          params: Dict[str, str]) -> Optional[str]:
-        """Trigger the workflow and return the run ID."""
-        # Resolve correct workflow filename
-        resolved_workflow = self._resolve_workflow_file(repo, workflow)
-        if resolved_workflow != workflow:
-            self.console.print(f"[dim]Resolved workflow: {resolved_workflow}[/dim]")
+    async def _find_resumable_run(self, repo: str, state_key: str) -> Optional[str]:
+        """Return the saved run ID for state_key if that run is still in progress."""
+        run_id = _load_run_state().get(state_key)
+        if not run_id:
+            return None
 
-        # Validate and fix parameters
-        fixed_params = self._validate_and_fix_params(repo, resolved_workflow, branch, params)
+        status_info = await self._get_run_status(repo, run_id)
+        if status_info and status_info.get("status") != "completed":
+            return run_id
 
-        cmd = ["gh", "workflow", "run", resolved_workflow, "-R", repo, "--ref", branch]
+        _update_run_state(state_key, None)
+        return None
 
-        for key, value in fixed_params.items():
-            cmd.extend(["-f", f"{key}={value}"])
+    async def _prefetch_workflow(self, repo: str, workflow: str, branch: str) -> None:
+        """Warm the (cached) workflow resolution and inputs that _trigger_workflow will use."""
+        if not workflow.endswith(('.yml', '.yaml')):
+            workflow = await self._resolve_workflow_file(repo, workflow)
+        await self._get_workflow_inputs(repo, workflow, branch)
+
+    async def _list_existing_runs(self, repo: str, workflow: str, branch: str) -> Set[str]:
+        """Get the IDs of a workflow's recent runs on branch, to tell a new run apart from."""
+        if not workflow.endswith(('.yml', '.yaml')):
+            workflow = await self._resolve_workflow_file(repo, workflow)
+        return set(await self._get_recent_run_ids(repo, workflow, self._created_since(), branch))
+
+    def _created_since(self) -> str:
+        """The UTC timestamp a newly triggered run can't have been created before."""
+        return time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - self.RUN_CREATE_CLOCK_SKEW)
+        )
+
+    async def _trigger_workflow(self, repo: str, workflow: str, branch: str,
+                          params: Dict[str, str], existing: Optional[Set[str]] = None) -> Optional[str]:
+        """
+        Trigger the workflow and return the run ID. `existing` holds the IDs of
+        runs listed before the trigger; they're listed here if it's not given.
+        """
+        # A file name with an extension is dispatched as given, and only
+        # resolved if gh can't find it
+        has_extension = workflow.endswith(('.yml', '.yaml'))
+        resolved_workflow = workflow
+        if not has_extension:
+            resolved_workflow = await self._resolve_workflow_file(repo, workflow)
+            if resolved_workflow != workflow:
+                self.console.print(f"[dim]Resolved workflow: {resolved_workflow}[/dim]")
+
+        # Only runs created around now can be the one being triggered
+        created_since = self._created_since()
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            returncode, stderr, existing = await self._dispatch_workflow(
+                repo, resolved_workflow, branch, params, created_since, existing
+            )
 
-            if result.returncode != 0:
-                self.console.print(f"[red]gh error: {result.stderr.strip()}[/red]")
+            if returncode != 0 and has_extension and "could not find" in stderr.lower():
+                resolved_workflow = await self._resolve_workflow_file(repo, workflow)
+                if resolved_workflow != workflow:
+                    self.console.print(f"[dim]Resolved workflow: {resolved_workflow}[/dim]")
+                    # The snapshot was of the unresolved name's runs, so take a new one
+                    returncode, stderr, existing = await self._dispatch_workflow(
+                        repo, resolved_workflow, branch, params, created_since
+                    )
+
+            if returncode != 0:
+                self.console.print(f"[red]gh error: {stderr.strip()}[/red]")
                 return None
 
-            # Wait for the run to be created
-            time.sleep(3)
-
-            # Get the most recent run ID
-            return self._get_latest_run_id(repo, resolved_workflow)
+            # Poll, backing off, until the new run is listed
+            deadline = time.monotonic() + self.RUN_CREATE_TIMEOUT
+            delay = self.RUN_CREATE_POLL_INTERVAL
+            while True:
+                run_ids = await self._get_recent_run_ids(repo, resolved_workflow, created_since, branch)
+                unclaimed = [run_id for run_id in run_ids if run_id not in self._claimed_run_ids]
+                for run_id in unclaimed:
+                    if run_id not in existing:
+                        self._claimed_run_ids.add(run_id)
+                        return run_id
+
+                if time.monotonic() >= deadline:
+                    # Fall back to the most recent run no other trigger has claimed
+                    if not run_ids:
+                        run_ids = await self._get_recent_run_ids(repo, resolved_workflow, branch=branch)
+                        unclaimed = [run_id for run_id in run_ids if run_id not in self._claimed_run_ids]
+                    if not unclaimed:
+                        return None
+                    self._claimed_run_ids.add(unclaimed[0])
+                    return unclaimed[0]
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.RUN_CREATE_MAX_POLL_INTERVAL)
 
         except Exception as e:
             self.console.print(f"[red]Error: {e}[/red]")
             return None
 
-    def _get_latest_run_id(self, repo: str, workflow: str) -> Optional[str]:
-        """Get the most recent workflow run ID."""
-        cmd = [
-            "gh", "run", "list",
-            "-R", repo,
-            "-w", workflow,
-            "--limit", "1",
-            "--json", "databaseId"
-        ]
+    async def _dispatch_workflow(self, repo: str, workflow: str, branch: str, params: Dict[str, str],
+                                 created_since: str, existing: Optional[Set[str]] = None
+                                 ) -> Tuple[int, str, Set[str]]:
+        """
+        Validate parameters and run `gh workflow run`, listing the existing runs
+        first unless they're given. Returns (returncode, stderr, existing run IDs).
+        """
+        if existing is None:
+            fixed_params, run_ids = await asyncio.gather(
+                self._validate_and_fix_params(repo, workflow, branch, params),
+                self._get_recent_run_ids(repo, workflow, created_since, branch)
+            )
+            existing = set(run_ids)
+        else:
+            fixed_params = await self._validate_and_fix_params(repo, workflow, branch, params)
+
+        args = ["workflow", "run", workflow, "-R", repo, "--ref", branch]
+
+        for key, value in fixed_params.items():
+            args.extend(["-f", f"{key}={value}"])
+
+        returncode, _, stderr = await self._gh(*args)
+        return returncode, stderr, existing
+
+    async def _get_recent_run_ids(self, repo: str, workflow: str, created_since: Optional[str] = None,
+                                  branch: Optional[str] = None, limit: int = 5) -> List[str]:
+        """
+        Get the IDs of the most recent workflow_dispatch runs, newest first,
+        optionally only those created at or after the given UTC timestamp or
+        on the given branch.
+        """
+        # Push, schedule etc. runs of the same workflow can't be the triggered run
+        endpoint = f"repos/{repo}/actions/workflows/{workflow}/runs?event=workflow_dispatch&per_page={limit}"
+        if created_since:
+            endpoint += "&created=" + quote(f">={created_since}")
+        if branch:
+            endpoint += "&branch=" + quote(branch)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                runs = json.loads(result.stdout)
-                if runs:
-                    return str(runs[0]["databaseId"])
+            status, _, body = await gh_api(
+                self._gh, self._rate_limit, endpoint, jq="[.workflow_runs[].id | tostring]"
+            )
+            if status == 200:
+                return json.loads(body)
+            if status == 404:
+                # Not a file name or ID the REST API knows, e.g. a display name
+                # that couldn't be resolved; gh run list matches those itself
+                args = ["run", "list", "-R", repo, "-w", workflow,
+                        "-e", "workflow_dispatch", "-L", str(limit),
+                        "--json", "databaseId", "--jq", "[.[].databaseId | tostring]"]
+                if branch:
+                    args.extend(["-b", branch])
+                returncode, stdout, _ = await self._gh(*args)
+                if returncode == 0:
+                    return json.loads(stdout)
         except Exception:
             pass
 
-        return None
+        return []
 
-    def _wait_for_completion(self, repo: str, run_id: str, verbose: bool) -> ScriptResult:
+    async def _wait_for_completion(self, repo: str, run_id: str, verbose: bool) -> ScriptResult:
         """Wait for the workflow to complete silently."""
         start_time = time.time()
         poll_interval = self._get_poll_interval()
         timeout = self._get_timeout()
         show_progress = self._get_show_progress()
 
+        # With a webhook listener the status is pushed to us instead of polled
+        waiters = await self._register_webhook_waiters([run_id])
+        completed = waiters[run_id] if waiters else None
+
         # Show minimal progress indicator
         if show_progress:
-            self.console.print(f"[dim]Waiting for workflow {run_id} to complete (polling every {poll_interval}s)...[/dim]")
+            if completed is not None:
+                self.console.print(f"[dim]Waiting for workflow {run_id} to complete (webhook on port {self._get_webhook_port()})...[/dim]")
+            else:
+                self.console.print(f"[dim]Waiting for workflow {run_id} to complete (polling up to every {poll_interval}s)...[/dim]")
 
-        while True:
-            status_info = self._get_run_status(repo, run_id)
+        attempt = 0
+        last_status = None
+        try:
+            while True:
+                if completed is not None and completed.done():
+                    status_info = completed.result()
+                else:
+                    # Still poll with a webhook, in case its delivery is lost
+                    status_info = await self._get_run_status(repo, run_id)
+
+                    if not status_info:
+                        return ScriptResult(
+                            success=False,
+                            message="Failed to get workflow status",
+                            errors=["Could not retrieve run status"]
+                        )
+
+                    # Poll quickly again after the run changes state (e.g. starts)
+                    if status_info.get("status") != last_status:
+                        last_status = status_info.get("status")
+                        attempt = 0
+
+                elapsed = int(time.time() - start_time)
+
+                # Check for completion
+                if status_info.get("status") == "completed":
+                    return self._completed_result(repo, run_id, status_info, elapsed, verbose)
+
+                # Check for timeout
+                if timeout > 0 and elapsed > timeout:
+                    return self._timeout_result(run_id, status_info, elapsed)
+
+                # Show progress dot
+                if show_progress:
+                    print(".", end="", flush=True)
+
+                # Hold off while the rate limit is nearly used up, but not past the timeout
+                await self._rate_limit.wait(timeout - elapsed if timeout > 0 else None)
+                if completed is None:
+                    delay = self.INITIAL_POLL_DELAY * self.POLL_BACKOFF ** attempt + random.uniform(0, 1)
+                    attempt += 1
+                    await asyncio.sleep(min(poll_interval, delay))
+                else:
+                    await asyncio.wait({completed}, timeout=poll_interval)
+        finally:
+            if waiters:
+                await self._unregister_webhook_waiters([run_id])
 
-            if not status_info:
-                return ScriptResult(
-                    success=False,
-                    message="Failed to get workflow status",
-                    errors=["Could not retrieve run status"]
-                )
+    async def _wait_for_many(self, runs: Dict[str, str], verbose: bool = False) -> Dict[str, ScriptResult]:
+        """
+        Wait for several workflow runs (run_id -> repo) to complete.
+        Returns a ScriptResult per run_id.
+        """
+        start_time = time.time()
+        poll_interval = self._get_poll_interval()
+        timeout = self._get_timeout()
 
-            elapsed = int(time.time() - start_time)
+        # With a webhook listener the statuses are pushed to us instead of polled
+        waiters = await self._register_webhook_waiters(list(runs))
 
-            # Check for completion
-            if status_info["status"] == "completed":
-                conclusion = status_info.get("conclusion", "unknown")
-                return ScriptResult(
-                    success=(conclusion == "success"),
-                    message=f"Workflow {conclusion}",
-                    data={
-                        "run_id": run_id,
-                        "conclusion": conclusion,
-                        "elapsed_seconds": elapsed,
-                        "url": status_info.get("url", ""),
-                        "status_info": status_info
-                    }
-                )
+        if self._get_show_progress():
+            if waiters is not None:
+                self.console.print(f"[dim]Waiting for {len(runs)} workflow(s) to complete (webhook on port {self._get_webhook_port()})...[/dim]")
+            else:
+                self.console.print(f"[dim]Waiting for {len(runs)} workflow(s) to complete (polling up to every {poll_interval}s)...[/dim]")
 
-            # Check for timeout
-            if timeout > 0 and elapsed > timeout:
-                return ScriptResult(
-                    success=False,
-                    message="Workflow timed out",
-                    data={
-                        "run_id": run_id,
-                        "elapsed_seconds": elapsed,
-                        "url": status_info.get("url", "")
-                    },
-                    errors=[f"Timeout after {elapsed}s"]
+        results: Dict[str, ScriptResult] = {}
+        pending = dict(runs)
+        last_statuses: Dict[str, Optional[str]] = {}
+        attempt = 0
+        try:
+            while pending:
+                # Still poll runs the webhook hasn't reported, in case a delivery is lost
+                reported = {
+                    run_id: waiters[run_id].result()
+                    for run_id in pending if waiters and waiters[run_id].done()
+                }
+                unreported = {run_id: repo for run_id, repo in pending.items() if run_id not in reported}
+                statuses = await self._get_run_statuses_batch(unreported) if unreported else {}
+                statuses.update(reported)
+                elapsed = int(time.time() - start_time)
+
+                for run_id in list(pending):
+                    status_info = statuses.get(run_id)
+                    if not status_info:
+                        results[run_id] = ScriptResult(
+                            success=False,
+                            message="Failed to get workflow status",
+                            errors=["Could not retrieve run status"]
+                        )
+                    elif status_info.get("status") == "completed":
+                        results[run_id] = self._completed_result(pending[run_id], run_id, status_info, elapsed, verbose)
+                    elif timeout > 0 and elapsed > timeout:
+                        results[run_id] = self._timeout_result(run_id, status_info, elapsed)
+                    else:
+                        # Poll quickly again after any run changes state
+                        if status_info.get("status") != last_statuses.get(run_id):
+                            last_statuses[run_id] = status_info.get("status")
+                            attempt = 0
+                        continue
+                    del pending[run_id]
+
+                if pending:
+                    if self._get_show_progress():
+                        print(".", end="", flush=True)
+                    await self._rate_limit.wait(timeout - elapsed if timeout > 0 else None)
+                    if waiters is None:
+                        delay = self.INITIAL_POLL_DELAY * self.POLL_BACKOFF ** attempt + random.uniform(0, 1)
+                        attempt += 1
+                        await asyncio.sleep(min(poll_interval, delay))
+                    else:
+                        await asyncio.wait([waiters[run_id] for run_id in pending], timeout=poll_interval,
+                                           return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if waiters:
+                await self._unregister_webhook_waiters(list(runs))
+
+        return results
+
+    def _completed_result(self, repo: str, run_id: str, status_info: Dict[str, Any],
+                          elapsed: int, verbose: bool) -> ScriptResult:
+        """Build the result for a completed run."""
+        conclusion = status_info.get("conclusion", "unknown")
+
+        # Start fetching any logs _display_final_result will show, so they
+        # download while the result table is rendered
+        if not self._quiet and (verbose or conclusion == "failure"):
+            self._log_fetches[run_id] = asyncio.create_task(self._fetch_logs(repo, run_id, verbose))
+
+        return ScriptResult(
+            success=(conclusion == "success"),
+            message=f"Workflow {conclusion}",
+            data={
+                "run_id": run_id,
+                "conclusion": conclusion,
+                "elapsed_seconds": elapsed,
+                "url": status_info.get("url", ""),
+                "status_info": status_info
+            }
+        )
+
+    def _timeout_result(self, run_id: str, status_info: Dict[str, Any], elapsed: int) -> ScriptResult:
+        """Build the result for a run that did not complete in time."""
+        return ScriptResult(
+            success=False,
+            message="Workflow timed out",
+            data={
+                "run_id": run_id,
+                "elapsed_seconds": elapsed,
+                "url": status_info.get("url", "")
+            },
+            errors=[f"Timeout after {elapsed}s"]
+        )
+
+    async def _register_webhook_waiters(self, run_ids: List[str]) -> Optional[Dict[str, asyncio.Future]]:
+        """
+        Register futures that the webhook listener resolves with each run's
+        status info when it completes, starting the listener if it isn't running.
+        Returns None if no webhook port is configured, GITHUB_WEBHOOK_SECRET
+        isn't set, or the listener can't be started.
+        """
+        port = self._get_webhook_port()
+        if not port:
+            return None
+
+        # Unsigned deliveries could set any run's conclusion, so don't accept them
+        if not os.environ.get("GITHUB_WEBHOOK_SECRET"):
+            self.console.print("[yellow]GITHUB_WEBHOOK_SECRET is not set, polling instead of using the webhook[/yellow]")
+            return None
+
+        if self._webhook_server is None:
+            try:
+                self._webhook_server = await asyncio.start_server(
+                    self._handle_webhook, host=self._get_webhook_host(), port=port
                 )
+            except OSError as e:
+                self.console.print(f"[yellow]Webhook listener unavailable ({e}), polling instead[/yellow]")
+                return None
+
+        loop = asyncio.get_running_loop()
+        return {run_id: self._webhook_waiters.setdefault(run_id, loop.create_future()) for run_id in run_ids}
+
+    async def _unregister_webhook_waiters(self, run_ids: List[str]) -> None:
+        """Drop the runs' webhook futures, stopping the listener once none are left."""
+        for run_id in run_ids:
+            self._webhook_waiters.pop(run_id, None)
+
+        if not self._webhook_waiters and self._webhook_server is not None:
+            server, self._webhook_server = self._webhook_server, None
+            server.close()
+            # wait_closed() also waits for open connections on newer Pythons,
+            # so end them rather than wait out a stalled sender
+            connections = dict(self._webhook_connections)
+            for writer in connections:
+                writer.close()
+            await asyncio.gather(*connections.values(), return_exceptions=True)
+            await server.wait_closed()
+
+    async def _handle_webhook(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle one webhook connection, resolving the future of the run it reports on."""
+        self._webhook_connections[writer] = asyncio.current_task()
+        try:
+            status_info = await self._read_webhook(reader, writer)
+        finally:
+            del self._webhook_connections[writer]
+        waiter = self._webhook_waiters.get(status_info["id"]) if status_info else None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(status_info)
+
+    async def _read_webhook(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> Optional[Dict[str, Any]]:
+        """Read one webhook delivery and return run status info for completed runs."""
+        async def read_request() -> Tuple[Dict[str, str], bytes]:
+            await reader.readline()  # Request line
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length", 0))
+            if not 0 <= length <= self.MAX_WEBHOOK_BODY:
+                raise ValueError(f"Webhook body of {length} bytes")
+            body = await reader.readexactly(length)
+            writer.write(b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            return headers, body
+
+        # Bounded, so a stalled sender can't hold up closing the listener
+        try:
+            headers, body = await asyncio.wait_for(read_request(), timeout=self.WEBHOOK_READ_TIMEOUT)
+        except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            return None
+        finally:
+            writer.close()
 
-            # Show progress dot
-            if show_progress:
-                print(".", end="", flush=True)
+        if headers.get("x-github-event") != "workflow_run":
+            return None
 
-            time.sleep(poll_interval)
+        secret = os.environ.get("GITHUB_WEBHOOK_SECRET", "")
+        expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        if not secret or not hmac.compare_digest(expected, headers.get("x-hub-signature-256", "")):
+            return None
 
-    def _get_run_status(self, repo: str, run_id: str) -> Optional[Dict[str, Any]]:
-        """Get the current status of a workflow run."""
-        cmd = [
-            "gh", "run", "view", run_id,
-            "-R", repo,
-            "--json", "status,conclusion,url,name,createdAt,updatedAt"
-        ]
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
 
+        run = payload.get("workflow_run") or {}
+        if payload.get("action") != "completed":
+            return None
+
+        return {
+            "id": str(run.get("id")),
+            "status": run.get("status"),
+            "conclusion": run.get("conclusion"),
+            "url": run.get("html_url", ""),
+            "name": run.get("name"),
+            "createdAt": run.get("created_at"),
+            "updatedAt": run.get("updated_at")
+        }
+
+    async def _get_run_status(self, repo: str, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current status of a workflow run.
+        Uses the last response's ETag so unchanged runs come back as 304 with no body.
+        """
+        cached = self._run_status_cache.get(run_id)
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                return json.loads(result.stdout)
+            status, headers, body = await gh_api(
+                self._gh, self._rate_limit, _run_endpoint(repo, run_id),
+                etag=cached[0] if cached else None,
+                jq=_RUN_STATUS_FIELDS
+            )
+            if status == 304 and cached:
+                return cached[1]
+            if status == 200:
+                run = json.loads(body)
+                status_info = {
+                    "status": run.get("status"),
+                    "conclusion": run.get("conclusion"),
+                    "url": run.get("html_url", ""),
+                    "name": run.get("name"),
+                    "createdAt": run.get("created_at"),
+                    "updatedAt": run.get("updated_at")
+                }
+                if headers.get("etag"):
+                    self._run_status_cache[run_id] = (headers["etag"], status_info)
+                if run.get("node_id"):
+                    self._run_node_ids[run_id] = run["node_id"]
+                return status_info
         except Exception:
             pass
 
         return None
 
+    async def _get_run_statuses_batch(self, runs: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current status of several workflow runs (run_id -> repo).
+        Runs whose GraphQL node ID is known are queried together in one request;
+        the rest go through _get_run_status, which records their node IDs.
+        Runs whose status can't be fetched are missing from the result.
+        """
+        node_ids = {self._run_node_ids[run_id]: run_id for run_id in runs if run_id in self._run_node_ids}
+        unknown = [run_id for run_id in runs if run_id not in self._run_node_ids]
+
+        statuses = {}
+        if unknown:
+            infos = await asyncio.gather(*(self._get_run_status(runs[run_id], run_id) for run_id in unknown))
+            statuses.update((run_id, info) for run_id, info in zip(unknown, infos) if info)
+
+        if not node_ids:
+            return statuses
+
+        args = ["api", "graphql", "-f", f"query={_RUN_STATUSES_QUERY}"]
+        for node_id in node_ids:
+            args.extend(["-f", f"ids[]={node_id}"])
+
+        try:
+            returncode, stdout, _ = await self._gh(*args)
+            if returncode != 0:
+                return statuses
+
+            for node in json.loads(stdout).get("data", {}).get("nodes") or []:
+                if not node:
+                    continue
+                check_suite = node.get("checkSuite") or {}
+                statuses[str(node["databaseId"])] = {
+                    "status": (check_suite.get("status") or "").lower(),
+                    "conclusion": (check_suite.get("conclusion") or "").lower() or None,
+                    "url": node.get("url", ""),
+                    "name": (node.get("workflow") or {}).get("name"),
+                    "createdAt": node.get("createdAt"),
+                    "updatedAt": node.get("updatedAt")
+                }
+        except Exception:
+            pass
+
+        return statuses
+
     def _display_triggered(self, project: str, repo: str, workflow: str,
                            branch: str, params: Dict[str, str], run_id: str) -> None:
         """Display triggered workflow info (for --no-wait)."""
-        self.console.print()
+        from rich.table import Table
+
+        rows = [
+            ("Repository", repo),
+            ("Workflow", workflow),
+            ("Branch", branch),
+            ("Run ID", run_id),
+            ("URL", f"https://github.com/{repo}/actions/runs/{run_id}"),
+        ]
+        if params:
+            rows.append(("Parameters", ", ".join(f"{k}={v}" for k, v in params.items())))
+
         table = Table(title=f"Workflow Triggered: {project}")
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="green")
+        for row in rows:
+            table.add_row(*row)
 
-        table.add_row("Repository", repo)
-        table.add_row("Workflow", workflow)
-        table.add_row("Branch", branch)
-        table.add_row("Run ID", run_id)
-        table.add_row("URL", f"https://github.com/{repo}/actions/runs/{run_id}")
-
-        if params:
-            params_str = ", ".join(f"{k}={v}" for k, v in params.items())
-            table.add_row("Parameters", params_str)
-
-        self.console.print(table)
+        with self.console:
+            self.console.print()
+            self.console.print(table)
 
-    def _display_final_result(self, project: str, repo: str, workflow: str,
+    async def _display_final_result(self, project: str, repo: str, workflow: str,
                               branch: str, params: Dict[str, str], run_id: str,
                               result: ScriptResult, verbose: bool) -> None:
         """Display the final workflow result."""
+        from rich.table import Table
+
         # Clear progress dots
         print()
 
@@ -461,66 +1161,62 @@ class WorkflowDispatchScript(BaseScript):
         url = result.data.get("url", f"https://github.com/{repo}/actions/runs/{run_id}")
 
         # Determine style based on conclusion
-        if conclusion == "success":
-            status_style = "green"
-            status_text = "SUCCESS"
-        elif conclusion == "failure":
-            status_style = "red"
-            status_text = "FAILURE"
-        elif conclusion == "cancelled":
-            status_style = "yellow"
-            status_text = "CANCELLED"
-        else:
-            status_style = "white"
-            status_text = conclusion.upper()
-
-        elapsed_str = f"{elapsed // 60}m {elapsed % 60}s"
+        status_style, status_text = _STATUS_STYLES.get(conclusion, ("white", conclusion.upper()))
+
+        rows = [
+            ("Status", f"[bold {status_style}]{status_text}[/bold {status_style}]"),
+            ("Repository", repo),
+            ("Workflow", workflow),
+            ("Branch", branch),
+            ("Run ID", run_id),
+            ("Duration", f"{elapsed // 60}m {elapsed % 60}s"),
+            ("URL", url),
+        ]
+        if params:
+            rows.append(("Parameters", ", ".join(f"{k}={v}" for k, v in params.items())))
 
         # Build result table
         table = Table(title=f"Workflow Result: {project}", style=status_style)
         table.add_column("Property", style="cyan")
         table.add_column("Value")
+        for row in rows:
+            table.add_row(*row)
 
-        table.add_row("Status", f"[bold {status_style}]{status_text}[/bold {status_style}]")
-        table.add_row("Repository", repo)
-        table.add_row("Workflow", workflow)
-        table.add_row("Branch", branch)
-        table.add_row("Run ID", run_id)
-        table.add_row("Duration", elapsed_str)
-        table.add_row("URL", url)
-
-        if params:
-            params_str = ", ".join(f"{k}={v}" for k, v in params.items())
-            table.add_row("Parameters", params_str)
-
-        self.console.print()
-        self.console.print(table)
+        with self.console:
+            self.console.print()
+            self.console.print(table)
 
         # Show logs if verbose or failed
         if verbose or conclusion == "failure":
-            self._show_workflow_logs(repo, run_id, verbose)
+            await self._show_workflow_logs(repo, run_id, verbose)
 
-    def _show_workflow_logs(self, repo: str, run_id: str, verbose: bool) -> None:
+    async def _show_workflow_logs(self, repo: str, run_id: str, verbose: bool) -> None:
         """Show workflow logs."""
+        from rich.panel import Panel
+
         self.console.print()
 
-        if verbose:
-            cmd = ["gh", "run", "view", run_id, "-R", repo, "--log"]
-            title = "Full Workflow Logs"
-        else:
-            cmd = ["gh", "run", "view", run_id, "-R", repo, "--log-failed"]
-            title = "Failed Job Logs"
+        title = "Full Workflow Logs" if verbose else "Failed Job Logs"
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.stdout:
-                # Truncate if too long
-                logs = result.stdout
-                if len(logs) > 15000:
-                    logs = logs[:15000] + "\n\n... (truncated, see GitHub for full logs)"
+            # Usually already under way, started by _completed_result
+            fetch = self._log_fetches.pop(run_id, None)
+            logs, truncated = await (fetch or self._fetch_logs(repo, run_id, verbose))
+            if logs:
+                if truncated:
+                    logs += "\n\n... (truncated, see GitHub for full logs)"
 
                 self.console.print(Panel(logs, title=title, expand=False))
             elif not verbose:
                 self.console.print("[dim]No failed job logs available[/dim]")
         except Exception as e:
             self.console.print(f"[red]Error fetching logs: {e}[/red]")
+
+    async def _fetch_logs(self, repo: str, run_id: str, verbose: bool) -> Tuple[str, bool]:
+        """
+        Fetch a run's full logs (verbose) or failed job logs.
+        Only the first MAX_LOG_BYTES are read; gh is stopped after that.
+        Returns (logs, truncated).
+        """
+        log_flag = "--log" if verbose else "--log-failed"
+        return await self._gh_head(self.MAX_LOG_BYTES, "run", "view", run_id, "-R", repo, log_flag)
@@ -1,17 +1,30 @@
 """GitHub Actions workflow list script - list available workflows and their inputs."""
 
-import base64
 import json
 import subprocess
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
-import yaml
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from scripts._console import get_console
+from scripts._gh import GH_BIN
+from scripts.base import BaseScript, ScriptConfig, ScriptResult, load_yaml, load_yaml_file, find_config_file
 
-from scripts.base import BaseScript, ScriptConfig, ScriptResult
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Fetches the contents of every file in a repository directory in one request
+_DIRECTORY_FILES_QUERY = """
+query($owner: String!, $name: String!, $expression: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      ... on Tree {
+        entries { name object { ... on Blob { text } } }
+      }
+    }
+  }
+}
+"""
 
 
 class WorkflowListScript(BaseScript):
@@ -23,8 +36,15 @@ class WorkflowListScript(BaseScript):
         version="1.0.0"
     )
 
+    # Parallel per-file fetches when the single directory query can't be used
+    MAX_FETCH_WORKERS = 10
+
+    @property
+    def console(self) -> "Console":
+        """Shared console for output."""
+        return get_console()
+
     def __init__(self):
-        self.console = Console()
         self.projects_config: Dict[str, Any] = {}
 
     def run(self, verbose: bool = False, **kwargs) -> ScriptResult:
@@ -81,40 +101,85 @@ class WorkflowListScript(BaseScript):
 
     def _load_projects_config(self) -> bool:
         """Load projects configuration from yaml file."""
-        config_paths = [
-            Path("projects.yaml"),
-            Path("/app/projects.yaml"),
-            Path.home() / ".config" / "agents" / "projects.yaml"
-        ]
-
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        self.projects_config = yaml.safe_load(f)
-                    return True
-                except Exception:
-                    return False
+        config_path = find_config_file("projects.yaml")
+        if config_path is None:
+            return False
 
-        return False
+        try:
+            self.projects_config = load_yaml_file(config_path)
+            return True
+        except Exception:
+            return False
 
     def _get_workflows(self, repo: str, branch: str) -> List[Dict[str, Any]]:
         """Get list of workflows from repository."""
-        cmd = ["gh", "workflow", "list", "-R", repo, "--json", "name,path,state"]
+        cmd = [GH_BIN, "workflow", "list", "-R", repo, "--json", "name,path,state"]
 
         try:
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode == 0:
                 workflows = json.loads(result.stdout)
-                # Fetch inputs for each workflow
+                # Fetch all workflow files at once, then read each one's inputs
+                contents = self._get_workflow_files(repo, branch)
+                missing = []
                 for wf in workflows:
-                    wf["inputs"] = self._get_workflow_inputs(repo, wf.get("path", ""), branch)
+                    path = wf.get("path", "")
+                    if path in contents:
+                        wf["inputs"] = self._parse_workflow_inputs(contents[path])
+                    else:
+                        missing.append(wf)
+                if missing:
+                    self._fetch_workflow_inputs(repo, branch, missing)
                 return workflows
         except Exception as e:
             self.console.print(f"[red]Error: {e}[/red]")
 
         return []
 
+    def _fetch_workflow_inputs(self, repo: str, branch: str, workflows: List[Dict[str, Any]]) -> None:
+        """Fetch inputs for workflows one file at a time, several requests in parallel."""
+        max_workers = min(self.MAX_FETCH_WORKERS, len(workflows))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._get_workflow_inputs, repo, wf.get("path", ""), branch): wf
+                for wf in workflows
+            }
+
+            for future in as_completed(futures):
+                wf = futures[future]
+                try:
+                    wf["inputs"] = future.result()
+                except Exception:
+                    wf["inputs"] = {}
+
+    def _get_workflow_files(self, repo: str, branch: str = None) -> Dict[str, str]:
+        """
+        Fetch the contents of every file in .github/workflows with one GraphQL query.
+        Returns a dict of path -> content; files GitHub returns no text for are left out.
+        """
+        owner, _, name = repo.partition("/")
+        cmd = [
+            GH_BIN, "api", "graphql",
+            "-f", f"query={_DIRECTORY_FILES_QUERY}",
+            "-f", f"owner={owner}",
+            "-f", f"name={name}",
+            "-f", f"expression={branch or 'HEAD'}:.github/workflows"
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                return {}
+
+            tree = (json.loads(result.stdout).get("data", {}).get("repository") or {}).get("object") or {}
+            return {
+                f".github/workflows/{entry['name']}": entry["object"]["text"]
+                for entry in tree.get("entries", [])
+                if (entry.get("object") or {}).get("text") is not None
+            }
+        except Exception:
+            return {}
+
     def _get_workflow_inputs(self, repo: str, workflow_path: str, branch: str = None) -> Dict[str, Any]:
         """Fetch inputs for a specific workflow."""
         if not workflow_path:
@@ -125,13 +190,20 @@ class WorkflowListScript(BaseScript):
             api_url = f"repos/{repo}/contents/{workflow_path}"
             if branch:
                 api_url += f"?ref={branch}"
-            cmd = ["gh", "api", api_url, "--jq", ".content"]
+            # Get the raw workflow file rather than base64-encoded JSON
+            cmd = [GH_BIN, "api", api_url, "-H", "Accept: application/vnd.github.raw"]
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 return {}
 
-            content = base64.b64decode(result.stdout.strip()).decode('utf-8')
-            workflow_yaml = yaml.safe_load(content)
+            return self._parse_workflow_inputs(result.stdout)
+        except Exception:
+            return {}
+
+    def _parse_workflow_inputs(self, content: str) -> Dict[str, Any]:
+        """Extract workflow_dispatch inputs from workflow file content."""
+        try:
+            workflow_yaml = load_yaml(content)
 
             inputs = {}
             # Handle 'on' key - YAML parses 'on' as boolean True, so check both
@@ -160,9 +232,8 @@ class WorkflowListScript(BaseScript):
 
     def _display_workflows(self, project: str, repo: str, workflows: List[Dict[str, Any]], verbose: bool) -> None:
         """Display workflows and their inputs."""
-        self.console.print()
-        self.console.print(f"[bold cyan]Workflows for {project}[/bold cyan] ({repo})")
-        self.console.print()
+        # Collect every line, then render and write them in one print
+        lines = ["", f"[bold cyan]Workflows for {project}[/bold cyan] ({repo})", ""]
 
         for wf in workflows:
             name = wf.get("name", "Unknown")
@@ -171,7 +242,7 @@ class WorkflowListScript(BaseScript):
             inputs = wf.get("inputs", {})
 
             state_style = "green" if state == "active" else "yellow"
-            self.console.print(f"  [bold]{path}[/bold] [{state_style}]{state}[/{state_style}]")
+            lines.append(f"  [bold]{path}[/bold] [{state_style}]{state}[/{state_style}]")
 
             if inputs:
                 for input_name, input_cfg in inputs.items():
@@ -185,16 +256,18 @@ class WorkflowListScript(BaseScript):
                     req_mark = "*" if required else ""
                     if options:
                         options_str = f"[{', '.join(options)}]"
-                        self.console.print(f"    [cyan]{input_name}{req_mark}[/cyan]: {options_str}")
+                        lines.append(f"    [cyan]{input_name}{req_mark}[/cyan]: {options_str}")
                     else:
-                        self.console.print(f"    [cyan]{input_name}{req_mark}[/cyan]: ({input_type})")
+                        lines.append(f"    [cyan]{input_name}{req_mark}[/cyan]: ({input_type})")
 
                     if default:
-                        self.console.print(f"      [dim]default: {default}[/dim]")
+                        lines.append(f"      [dim]default: {default}[/dim]")
 
                     if verbose and description:
-                        self.console.print(f"      [dim]{description}[/dim]")
+                        lines.append(f"      [dim]{description}[/dim]")
             else:
-                self.console.print("    [dim]No workflow_dispatch inputs[/dim]")
+                lines.append("    [dim]No workflow_dispatch inputs[/dim]")
+
+            lines.append("")
 
-            self.console.print()
+        self.console.print("\n".join(lines))
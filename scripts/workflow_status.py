@@ -2,14 +2,29 @@
 
 import json
 import subprocess
-from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
-import yaml
-from rich.console import Console
-from rich.table import Table
+from scripts._console import get_console
+from scripts._gh import GH_BIN
+from scripts._workflow_runs import (
+    LATEST_RUNS_QUERY, get_workflow_node_id, load_workflow_ids, run_info_from_json, run_info_from_node,
+    save_workflow_ids
+)
+from scripts.base import BaseScript, ScriptConfig, ScriptResult, load_yaml_file, find_config_file
 
-from scripts.base import BaseScript, ScriptConfig, ScriptResult
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Conclusion, or status of an unfinished run -> (style, label) for display
+_STATUS_STYLES = {
+    "success": ("green", "SUCCESS"),
+    "failure": ("red", "FAILURE"),
+    "cancelled": ("yellow", "CANCELLED"),
+    "in_progress": ("cyan", "IN PROGRESS"),
+    "queued": ("blue", "QUEUED"),
+}
 
 
 class WorkflowStatusScript(BaseScript):
@@ -21,8 +36,18 @@ class WorkflowStatusScript(BaseScript):
         version="1.0.0"
     )
 
+    # Logs beyond this size are cut off
+    MAX_LOG_BYTES = 15000
+
+    # Parallel gh calls for workflows the batched query can't cover
+    MAX_FETCH_WORKERS = 5
+
+    @property
+    def console(self) -> "Console":
+        """Shared console for output."""
+        return get_console()
+
     def __init__(self):
-        self.console = Console()
         self.projects_config: Dict[str, Any] = {}
 
     def run(self, verbose: bool = False, **kwargs) -> ScriptResult:
@@ -31,13 +56,17 @@ class WorkflowStatusScript(BaseScript):
 
         Args:
             verbose: If True, show workflow logs
-            project: Project name from projects.yaml
+            project: Project name from projects.yaml, or a list of names
+                     to check together
             workflow: Override workflow file (optional)
 
         Returns:
             ScriptResult with workflow status
         """
         project = kwargs.get("project")
+        if isinstance(project, (list, tuple)):
+            return self.run_many(list(project), verbose=verbose, **kwargs)
+
         workflow_override = kwargs.get("workflow")
 
         # Load projects configuration
@@ -86,29 +115,84 @@ class WorkflowStatusScript(BaseScript):
             data=run_info
         )
 
+    def run_many(self, projects: List[str], verbose: bool = False, **kwargs) -> ScriptResult:
+        """
+        Check the last workflow run of several projects at once.
+
+        The latest runs are fetched together in one GraphQL request; workflows
+        it can't answer for fall back to `gh run list`. Accepts the same keyword
+        arguments as run() (other than project).
+
+        Returns:
+            ScriptResult with data["runs"] mapping each project to its run details
+        """
+        workflow_override = kwargs.get("workflow")
+
+        if not self._load_projects_config():
+            return ScriptResult(
+                success=False,
+                message="Failed to load projects.yaml",
+                errors=["projects.yaml not found or invalid"]
+            )
+
+        configured = self.projects_config.get("projects", {})
+        targets = {}
+        for project in projects:
+            if project not in configured:
+                return ScriptResult(
+                    success=False,
+                    message=f"Project '{project}' not found",
+                    errors=[f"Available projects: {', '.join(configured)}"]
+                )
+            project_cfg = configured[project]
+            targets[project] = (
+                project_cfg["repo"],
+                workflow_override or project_cfg.get("workflow", "workflow.yaml")
+            )
+
+        last_runs = self._get_last_runs(list(set(targets.values())))
+
+        runs = {}
+        errors = []
+        for project, (repo, workflow) in targets.items():
+            run_info = last_runs.get((repo, workflow))
+            if not run_info:
+                errors.append(f"{project}: no runs found for {workflow} in {repo}")
+                continue
+
+            self._display_status(project, repo, workflow, run_info)
+            if verbose:
+                self._show_logs(repo, run_info["id"])
+
+            runs[project] = run_info
+            conclusion = run_info.get("conclusion", "")
+            status = run_info.get("status", "")
+            if not (conclusion == "success" or status == "in_progress"):
+                errors.append(f"{project}: {conclusion or status}")
+
+        return ScriptResult(
+            success=not errors,
+            message=f"{len(targets) - len(errors)}/{len(targets)} workflow(s) OK",
+            data={"runs": runs},
+            errors=errors
+        )
+
     def _load_projects_config(self) -> bool:
         """Load projects configuration from yaml file."""
-        config_paths = [
-            Path("projects.yaml"),
-            Path("/app/projects.yaml"),
-            Path.home() / ".config" / "agents" / "projects.yaml"
-        ]
-
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        self.projects_config = yaml.safe_load(f)
-                    return True
-                except Exception:
-                    return False
+        config_path = find_config_file("projects.yaml")
+        if config_path is None:
+            return False
 
-        return False
+        try:
+            self.projects_config = load_yaml_file(config_path)
+            return True
+        except Exception:
+            return False
 
     def _get_last_run(self, repo: str, workflow: str) -> Optional[Dict[str, Any]]:
         """Get the last workflow run."""
         cmd = [
-            "gh", "run", "list",
+            GH_BIN, "run", "list",
             "-R", repo,
             "-w", workflow,
             "--limit", "1",
@@ -120,39 +204,93 @@ class WorkflowStatusScript(BaseScript):
             if result.returncode == 0:
                 runs = json.loads(result.stdout)
                 if runs:
-                    run = runs[0]
-                    run["id"] = str(run["databaseId"])
-                    run["url"] = f"https://github.com/{repo}/actions/runs/{run['id']}"
-                    return run
+                    return run_info_from_json(repo, runs[0])
         except Exception as e:
             self.console.print(f"[red]Error: {e}[/red]")
 
         return None
 
+    def _get_last_runs(self, workflows: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """
+        Get the last run of several (repo, workflow) pairs, in one GraphQL request
+        for those whose node ID is known and one `gh run list` for each of the rest.
+        """
+        cached_ids = load_workflow_ids()
+        node_ids = {}
+        unknown = []
+        for repo, workflow in workflows:
+            node_id = cached_ids.get(f"{repo}|{workflow}")
+            if node_id:
+                node_ids[(repo, workflow)] = node_id
+            else:
+                unknown.append((repo, workflow))
+
+        if unknown:
+            with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as executor:
+                found = list(executor.map(lambda key: get_workflow_node_id(*key), unknown))
+            for (repo, workflow), node_id in zip(unknown, found):
+                if node_id:
+                    node_ids[(repo, workflow)] = cached_ids[f"{repo}|{workflow}"] = node_id
+            save_workflow_ids(cached_ids)
+
+        runs, stale = self._get_last_runs_batch(node_ids) if node_ids else ({}, [])
+        if stale:
+            for repo, workflow in stale:
+                cached_ids.pop(f"{repo}|{workflow}", None)
+            save_workflow_ids(cached_ids)
+
+        # Workflows the batch couldn't answer for (names rather than files, deleted workflows)
+        missing = [key for key in workflows if key not in runs]
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as executor:
+                runs.update(zip(missing, executor.map(lambda key: self._get_last_run(*key), missing)))
+
+        return runs
+
+    def _get_last_runs_batch(self, node_ids: Dict[Tuple[str, str], str]) -> Tuple[Dict[Tuple[str, str], Optional[Dict[str, Any]]], List[Tuple[str, str]]]:
+        """
+        Get the last run of several workflows ((repo, workflow) -> node ID) in one
+        GraphQL request. Returns the runs found (None for a workflow with no runs)
+        and the workflows whose node ID no longer resolves.
+        """
+        keys = list(node_ids)
+        cmd = [GH_BIN, "api", "graphql", "-f", f"query={LATEST_RUNS_QUERY}", "-F", "first=1"]
+        for key in keys:
+            cmd.extend(["-f", f"ids[]={node_ids[key]}"])
+
+        try:
+            # gh exits non-zero if any ID fails to resolve, but still prints the rest
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            nodes = (json.loads(result.stdout).get("data") or {}).get("nodes") or []
+        except Exception:
+            return {}, []
+
+        runs = {}
+        stale = []
+        for (repo, workflow), node in zip(keys, nodes):
+            if not node:
+                stale.append((repo, workflow))
+                continue
+
+            latest = (node.get("runs") or {}).get("nodes") or []
+            if not latest:
+                runs[(repo, workflow)] = None
+                continue
+            runs[(repo, workflow)] = run_info_from_node(repo, latest[0])
+
+        return runs, stale
+
     def _display_status(self, project: str, repo: str, workflow: str, run_info: Dict[str, Any]) -> None:
         """Display the workflow status."""
+        from rich.table import Table
+
         status = run_info.get("status", "unknown")
         conclusion = run_info.get("conclusion", "")
 
         # Determine style
-        if conclusion == "success":
-            style = "green"
-            status_text = "SUCCESS"
-        elif conclusion == "failure":
-            style = "red"
-            status_text = "FAILURE"
-        elif conclusion == "cancelled":
-            style = "yellow"
-            status_text = "CANCELLED"
-        elif status == "in_progress":
-            style = "cyan"
-            status_text = "IN PROGRESS"
-        elif status == "queued":
-            style = "blue"
-            status_text = "QUEUED"
-        else:
-            style = "white"
-            status_text = (conclusion or status).upper()
+        style, status_text = _STATUS_STYLES.get(
+            conclusion or status, ("white", (conclusion or status).upper())
+        )
 
         table = Table(title=f"Workflow Status: {project}", style=style)
         table.add_column("Property", style="cyan")
@@ -174,14 +312,18 @@ class WorkflowStatusScript(BaseScript):
         self.console.print()
         self.console.print("[cyan]Fetching logs...[/cyan]")
 
-        cmd = ["gh", "run", "view", run_id, "-R", repo, "--log"]
+        cmd = [GH_BIN, "run", "view", run_id, "-R", repo, "--log"]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.stdout:
-                logs = result.stdout
-                if len(logs) > 15000:
-                    logs = logs[:15000] + "\n\n... (truncated)"
+            # Read only as much as is shown, then stop gh
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+                data = proc.stdout.read(self.MAX_LOG_BYTES + 1)
+                proc.kill()
+
+            if data:
+                logs = data[:self.MAX_LOG_BYTES].decode(errors="replace")
+                if len(data) > self.MAX_LOG_BYTES:
+                    logs += "\n\n... (truncated)"
                 self.console.print(logs)
         except Exception as e:
             self.console.print(f"[red]Error fetching logs: {e}[/red]")
@@ -1,17 +1,73 @@
 """GitHub Actions workflow status all script - check status of all projects."""
 
+import asyncio
+import functools
 import json
-import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timezone
+import os
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+from urllib.parse import quote
 
-import yaml
-from rich.console import Console
-from rich.table import Table
+from scripts._cache import async_ttl_cache, load_json_cache, save_json_cache
+from scripts._console import get_console
+from scripts._gh import GH_BIN, RateLimit, gh_api
+from scripts._workflow_runs import (
+    LATEST_RUNS_QUERY, load_workflow_ids, run_info_from_json, run_info_from_node, save_workflow_ids
+)
+from scripts.base import BaseScript, ScriptConfig, ScriptResult, load_yaml_file, find_config_file
 
-from scripts.base import BaseScript, ScriptConfig, ScriptResult
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Extension each workflow file was last found with ("repo|base name" -> ".yml"
+# or ".yaml"), so that one is tried first
+WORKFLOW_EXT_PATH = Path.home() / ".cache" / "agents" / "workflow_ext.json"
+
+# Last run of each workflow on a branch, as returned by the REST API, with the
+# ETag to revalidate it ("repo|workflow|branch" -> {"etag": ..., "runs": [...]});
+# a 304 reply doesn't count against the rate limit
+RUNS_ETAG_PATH = Path.home() / ".cache" / "agents" / "gh_etags.json"
+
+# Entries kept in each cache above; least recently used first
+MAX_CACHE_ENTRIES = 100
+
+# Reduces a workflow runs response to the fields `gh run list --json` would give
+_LAST_RUN_FIELDS = (
+    "[.workflow_runs[:1][] | {databaseId: .id, status, conclusion, createdAt: .created_at, "
+    "updatedAt: .updated_at, headBranch: .head_branch, event, name, url: .html_url}]"
+)
+
+# Thresholds of the "Last Run" column, in seconds
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Status column markup by run conclusion, or by status while the run isn't done
+_STATUS_TEXT = {
+    "success": "[green]SUCCESS[/green]",
+    "failure": "[red]FAILURE[/red]",
+    "cancelled": "[yellow]CANCELLED[/yellow]",
+    "in_progress": "[cyan]RUNNING[/cyan]",
+    "queued": "[blue]QUEUED[/blue]",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _workflow_file_names(workflow: str) -> Tuple[str, str, str]:
+    """(base name, .yml name, .yaml name) of a configured workflow, built once per name."""
+    base_name = workflow.removesuffix('.yml').removesuffix('.yaml')
+    return base_name, base_name + '.yml', base_name + '.yaml'
+
+
+def _touch_cache(cache: Dict[str, Any], key: str, value: Any) -> None:
+    """Store a cache entry as the most recently used, evicting the oldest if full."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > MAX_CACHE_ENTRIES:
+        del cache[next(iter(cache))]
 
 
 class WorkflowStatusAllScript(BaseScript):
@@ -23,16 +79,49 @@ class WorkflowStatusAllScript(BaseScript):
         version="1.0.0"
     )
 
+    # How many of a workflow's latest runs the batched query looks through
+    # for one on the project's branch
+    RUNS_PER_WORKFLOW = 20
+
+    # gh processes run at once
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # Requests wait for the rate limit reset once this few REST requests remain,
+    # but for no longer than this many seconds
+    RATE_LIMIT_RESERVE = 100
+    RATE_LIMIT_MAX_WAIT = 30
+
+    @property
+    def console(self) -> "Console":
+        """Shared console for output."""
+        return get_console()
+
     def __init__(self):
-        self.console = Console()
         self.projects_config: Dict[str, Any] = {}
+        # Loaded from WORKFLOW_EXT_PATH and RUNS_ETAG_PATH for each status check
+        self._workflow_ext: Dict[str, str] = {}
+        self._run_etags: Dict[str, Dict[str, Any]] = {}
+        # Bounds concurrent gh processes; created for each status check
+        self._gh_slots: Optional[asyncio.Semaphore] = None
+        # From the last REST API response
+        self._rate_limit = RateLimit(self.RATE_LIMIT_RESERVE)
 
     def run(self, verbose: bool = False, **kwargs) -> ScriptResult:
         """
         Check status of all projects in parallel.
 
+        Runs run_async() on a new event loop; see it for the arguments.
+        """
+        return asyncio.run(self.run_async(verbose=verbose, **kwargs))
+
+    async def run_async(self, verbose: bool = False, **kwargs) -> ScriptResult:
+        """
+        Check status of all projects in parallel.
+
         Args:
             verbose: If True, show additional details
+            sort: If True, order projects by name (default: projects.yaml order)
+            quiet: Don't show the status table, only return the results (default: False)
 
         Returns:
             ScriptResult with all project statuses
@@ -54,10 +143,11 @@ class WorkflowStatusAllScript(BaseScript):
             )
 
         # Fetch status for all projects in parallel
-        results = self._fetch_all_statuses(projects)
+        results = await self._fetch_all_statuses(projects)
 
         # Display results
-        self._display_status_table(results)
+        if not kwargs.get("quiet", False):
+            self._display_status_table(results, sort=kwargs.get("sort", False))
 
         # Determine overall success
         all_success = all(
@@ -73,115 +163,276 @@ class WorkflowStatusAllScript(BaseScript):
 
     def _load_projects_config(self) -> bool:
         """Load projects configuration from yaml file."""
-        config_paths = [
-            Path("projects.yaml"),
-            Path("/app/projects.yaml"),
-            Path.home() / ".config" / "agents" / "projects.yaml"
-        ]
+        config_path = find_config_file("projects.yaml")
+        if config_path is None:
+            return False
+
+        try:
+            self.projects_config = load_yaml_file(config_path)
+            return True
+        except Exception:
+            return False
+
+    async def _gh(self, *args: str) -> Tuple[int, bytes]:
+        """
+        Run a gh CLI command and return (returncode, stdout). stdout is left
+        undecoded, since json.loads() takes bytes; stderr isn't read.
+        At most MAX_CONCURRENT_REQUESTS run at once, and none while the
+        rate limit is nearly used up (up to RATE_LIMIT_MAX_WAIT).
+        """
+        # Wait before taking a slot, so waiting calls don't hold them
+        await self._rate_limit.wait(self.RATE_LIMIT_MAX_WAIT)
+        async with self._gh_slots:
+            proc = await asyncio.create_subprocess_exec(
+                GH_BIN, *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await proc.communicate()
+            return proc.returncode, stdout
+
+    async def _fetch_all_statuses(self, projects: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch status for all projects: in one GraphQL request where possible,
+        and in concurrent REST calls for the rest.
+        """
+        self._gh_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._workflow_ext = load_json_cache(WORKFLOW_EXT_PATH)
+        self._run_etags = load_json_cache(RUNS_ETAG_PATH)
+        saved_ext = list(self._workflow_ext.items())
+        saved_etags = list(self._run_etags.items())
+        try:
+            return await self._fetch_statuses(projects)
+        finally:
+            if list(self._workflow_ext.items()) != saved_ext:
+                save_json_cache(WORKFLOW_EXT_PATH, self._workflow_ext)
+            if list(self._run_etags.items()) != saved_etags:
+                save_json_cache(RUNS_ETAG_PATH, self._run_etags)
+
+    async def _fetch_statuses(self, projects: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Body of _fetch_all_statuses."""
+        results = await self._fetch_statuses_batch(projects)
+
+        missing = [name for name in projects if name not in results]
+        if not missing:
+            return {name: results[name] for name in projects}
+
+        statuses = await asyncio.gather(
+            *(self._get_project_status(name, projects[name]) for name in missing),
+            return_exceptions=True
+        )
+        for project_name, status in zip(missing, statuses):
+            if isinstance(status, Exception):
+                results[project_name] = {"error": str(status)}
+            else:
+                results[project_name] = status
+
+        return {name: results[name] for name in projects}
 
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        self.projects_config = yaml.safe_load(f)
-                    return True
-                except Exception:
-                    return False
+    async def _fetch_statuses_batch(self, projects: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch the last run on each project's branch with one GraphQL query over
+        the workflows' recent runs. Projects it can't answer for (workflow not
+        found, or no run on the branch among the latest RUNS_PER_WORKFLOW) are
+        left out of the result.
+        """
+        cached_ids = load_workflow_ids()
+
+        # project -> (repo, workflow file, branch, workflow node ID)
+        targets: Dict[str, Tuple[str, str, str, str]] = {}
+        unknown = []
+        for name, cfg in projects.items():
+            repo = cfg.get("repo")
+            branch = cfg.get("branch", "main")
+            for workflow in self._workflow_variants(repo, cfg.get("workflow", "workflow.yaml")):
+                node_id = cached_ids.get(f"{repo}|{workflow}")
+                if node_id:
+                    targets[name] = (repo, workflow, branch, node_id)
+                    self._remember_workflow(repo, workflow)
+                    break
+            else:
+                unknown.append(name)
+
+        # Look up node IDs of workflows not seen before, listing each repo's
+        # workflows once rather than probing each file name
+        if unknown:
+            repos = list({projects[name].get("repo") for name in unknown})
+            listings = dict(zip(repos, await asyncio.gather(*(self._list_workflows(repo) for repo in repos))))
+            for name in unknown:
+                cfg = projects[name]
+                repo = cfg.get("repo")
+                for workflow in self._workflow_variants(repo, cfg.get("workflow", "workflow.yaml")):
+                    node_id = listings[repo].get(f".github/workflows/{workflow}")
+                    if node_id:
+                        cached_ids[f"{repo}|{workflow}"] = node_id
+                        targets[name] = (repo, workflow, cfg.get("branch", "main"), node_id)
+                        self._remember_workflow(repo, workflow)
+                        break
+            save_workflow_ids(cached_ids)
+
+        if not targets:
+            return {}
+
+        names = list(targets)
+        args = [
+            "api", "graphql",
+            "-f", f"query={LATEST_RUNS_QUERY}",
+            "-F", f"first={self.RUNS_PER_WORKFLOW}"
+        ]
+        for name in names:
+            args.extend(["-f", f"ids[]={targets[name][3]}"])
 
-        return False
+        try:
+            # gh exits non-zero if any ID fails to resolve, but still prints the rest
+            _, stdout = await self._gh(*args)
+            nodes = (json.loads(stdout).get("data") or {}).get("nodes") or []
+        except Exception:
+            return {}
 
-    def _fetch_all_statuses(self, projects: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
-        """Fetch status for all projects in parallel."""
         results = {}
+        stale = False
+        for name, node in zip(names, nodes):
+            repo, workflow, branch, _ = targets[name]
+            if not node:
+                # The workflow is gone (or renamed); forget its ID
+                cached_ids.pop(f"{repo}|{workflow}", None)
+                stale = True
+                continue
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {
-                executor.submit(self._get_project_status, name, cfg): name
-                for name, cfg in projects.items()
-            }
+            runs = (node.get("runs") or {}).get("nodes") or []
+            run = next((r for r in runs if ((r.get("checkSuite") or {}).get("branch") or {}).get("name") == branch), None)
+            if run:
+                run_info = run_info_from_node(repo, run)
+                run_info["repo"] = repo
+                run_info["workflow"] = workflow
+                results[name] = run_info
+            elif len(runs) < self.RUNS_PER_WORKFLOW:
+                # Every run of the workflow was returned, and none is on this branch
+                results[name] = None
 
-            for future in as_completed(futures):
-                project_name = futures[future]
-                try:
-                    results[project_name] = future.result()
-                except Exception as e:
-                    results[project_name] = {"error": str(e)}
+        if stale:
+            save_workflow_ids(cached_ids)
 
         return results
 
-    def _get_project_status(self, project_name: str, project_cfg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def _list_workflows(self, repo: str) -> Dict[str, str]:
+        """Get a repo's workflows as a dict of path -> GraphQL node ID; empty on failure."""
+        try:
+            returncode, stdout = await self._gh(
+                "api", f"repos/{repo}/actions/workflows?per_page=100",
+                "--jq", "[.workflows[] | {key: .path, value: .node_id}] | from_entries"
+            )
+            if returncode == 0:
+                workflows = json.loads(stdout)
+                return workflows if isinstance(workflows, dict) else {}
+        except Exception:
+            pass
+
+        return {}
+
+    def _workflow_variants(self, repo: str, workflow: str) -> Tuple[str, str]:
+        """
+        The .yml and .yaml file names a configured workflow may have, the one
+        it was last found with first.
+        """
+        base_name, yml_name, yaml_name = _workflow_file_names(workflow)
+        if self._workflow_ext.get(f"{repo}|{base_name}") == ".yaml":
+            return yaml_name, yml_name
+        return yml_name, yaml_name
+
+    def _remember_workflow(self, repo: str, workflow: str) -> None:
+        """Record the extension a workflow file was found with."""
+        base_name, ext = os.path.splitext(workflow)
+        _touch_cache(self._workflow_ext, f"{repo}|{base_name}", ext)
+
+    async def _get_project_status(self, project_name: str, project_cfg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Get status for a single project."""
         repo = project_cfg.get("repo")
         workflow = project_cfg.get("workflow", "workflow.yaml")
         branch = project_cfg.get("branch", "main")
 
-        # Try both extensions
-        for ext in ['.yml', '.yaml']:
-            base_name = workflow.removesuffix('.yml').removesuffix('.yaml')
-            test_workflow = base_name + ext
-
-            run_info = self._get_last_run(repo, test_workflow, branch)
-            if run_info:
-                run_info["workflow"] = test_workflow
+        # Try both extensions, the last one found first; the first file that
+        # exists answers, even if it has no run on the branch
+        for test_workflow in self._workflow_variants(repo, workflow):
+            found, run_info = await self._get_last_run(repo, test_workflow, branch)
+            if found:
+                self._remember_workflow(repo, test_workflow)
                 return run_info
 
         return None
 
-    def _get_last_run(self, repo: str, workflow: str, branch: str) -> Optional[Dict[str, Any]]:
-        """Get the last workflow run for a specific branch."""
-        cmd = [
-            "gh", "run", "list",
-            "-R", repo,
-            "-w", workflow,
-            "-b", branch,
-            "--limit", "1",
-            "--json", "databaseId,status,conclusion,createdAt,headBranch,event"
-        ]
+    # Projects sharing a workflow and branch (or a second status check within
+    # 30s) reuse one lookup, including a miss on the other extension
+    @async_ttl_cache(maxsize=100, ttl=30)
+    async def _get_last_run(self, repo: str, workflow: str,
+                            branch: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Get the last workflow run for a specific branch, revalidating the one
+        fetched before (if any) with its ETag.
+        Returns (whether the workflow was found, the run or None).
+        """
+        key = f"{repo}|{workflow}|{branch}"
+        cached = self._run_etags.get(key)
+        endpoint = f"repos/{repo}/actions/workflows/{workflow}/runs?branch={quote(branch, safe='')}&per_page=1"
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                runs = json.loads(result.stdout)
-                if runs:
-                    run = runs[0]
-                    run["id"] = str(run["databaseId"])
-                    run["repo"] = repo
-                    return run
+            status, headers, body = await gh_api(
+                self._gh, self._rate_limit, endpoint, etag=cached and cached.get("etag"), jq=_LAST_RUN_FIELDS
+            )
+            if status == 304 and cached:
+                runs = cached["runs"]
+            elif status == 200:
+                runs = json.loads(body)
+                if "etag" in headers:
+                    cached = {"etag": headers["etag"], "runs": runs}
+                else:
+                    cached = None
+            else:
+                return False, None
+
+            if cached:
+                _touch_cache(self._run_etags, key, cached)
+            if runs:
+                run = run_info_from_json(repo, runs[0])
+                run["repo"] = repo
+                run["workflow"] = workflow
+                return True, run
+            return True, None
         except Exception:
             pass
 
-        return None
+        return False, None
 
-    def _format_relative_time(self, timestamp: str) -> str:
-        """Format timestamp as relative time."""
+    def _format_relative_time(self, timestamp: str, now: float) -> str:
+        """Format timestamp as relative time, as of `now` (a time.time() value)."""
         try:
-            created = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            now = datetime.now(timezone.utc)
-            delta = now - created
+            # fromisoformat() reads the trailing "Z" itself on Python 3.11+
+            seconds = now - datetime.fromisoformat(timestamp).timestamp()
 
-            if delta.total_seconds() < 60:
+            if seconds < MINUTE:
                 return "just now"
-            elif delta.total_seconds() < 3600:
-                mins = int(delta.total_seconds() / 60)
-                return f"{mins}m ago"
-            elif delta.total_seconds() < 86400:
-                hours = int(delta.total_seconds() / 3600)
-                return f"{hours}h ago"
+            elif seconds < HOUR:
+                return f"{int(seconds / MINUTE)}m ago"
+            elif seconds < DAY:
+                return f"{int(seconds / HOUR)}h ago"
             else:
-                days = int(delta.total_seconds() / 86400)
-                return f"{days}d ago"
+                return f"{int(seconds / DAY)}d ago"
         except Exception:
             return timestamp[:10] if timestamp else "unknown"
 
-    def _display_status_table(self, results: Dict[str, Optional[Dict[str, Any]]]) -> None:
-        """Display status table for all projects."""
+    def _display_status_table(self, results: Dict[str, Optional[Dict[str, Any]]], sort: bool = False) -> None:
+        """Display status table for all projects, in the order of `results` unless sorted by name."""
+        from rich.table import Table
+
         table = Table(title="Workflow Status: All Projects")
         table.add_column("Project", style="cyan")
         table.add_column("Status")
         table.add_column("Branch")
         table.add_column("Last Run")
 
-        for project_name, run_info in sorted(results.items()):
+        now = time.time()
+        rows = sorted(results.items()) if sort else results.items()
+        for project_name, run_info in rows:
             if not run_info or "error" in run_info:
                 error_msg = run_info.get("error", "No runs found") if run_info else "No runs found"
                 table.add_row(
@@ -197,23 +448,17 @@ class WorkflowStatusAllScript(BaseScript):
             branch = run_info.get("headBranch", "")
             created = run_info.get("createdAt", "")
 
-            # Format status
-            if conclusion == "success":
-                status_text = "[green]SUCCESS[/green]"
-            elif conclusion == "failure":
-                status_text = "[red]FAILURE[/red]"
-            elif conclusion == "cancelled":
-                status_text = "[yellow]CANCELLED[/yellow]"
-            elif status == "in_progress":
-                status_text = "[cyan]RUNNING[/cyan]"
-            elif status == "queued":
-                status_text = "[blue]QUEUED[/blue]"
-            else:
-                status_text = f"[white]{(conclusion or status).upper()}[/white]"
+            status_text = (
+                _STATUS_TEXT.get(conclusion)
+                or _STATUS_TEXT.get(status)
+                or f"[white]{(conclusion or status).upper()}[/white]"
+            )
 
-            relative_time = self._format_relative_time(created)
+            relative_time = self._format_relative_time(created, now)
 
             table.add_row(project_name, status_text, branch, relative_time)
 
-        self.console.print()
-        self.console.print(table)
+        # Lay out the table and write it with the blank line above in one flush
+        with self.console:
+            self.console.print()
+            self.console.print(table)